@@ -0,0 +1,94 @@
+#!/usr/bin/env node
+
+/**
+ * Benchmark the near-duplicate index on synthetic scholarships.
+ *
+ * Usage: ts-node scripts/benchmark-duplicate-index.ts [size ...]
+ * Defaults to 10k, 100k and 1M records. Run with --expose-gc
+ * (node -r ts-node/register --expose-gc ...) for steadier memory numbers;
+ * the 1M run needs --max-old-space-size=4096 or more.
+ */
+
+import { DuplicateIndexService } from '../src/services/duplicateIndexService';
+import { createRandom } from './random';
+
+const QUERY_COUNT = 1000;
+
+const WORDS = [
+  'merit', 'community', 'leadership', 'stem', 'future', 'women', 'first', 'generation',
+  'nursing', 'engineering', 'arts', 'service', 'excellence', 'heritage', 'rural', 'graduate',
+  'undergraduate', 'teacher', 'veterans', 'innovation', 'business', 'health', 'music', 'science'
+];
+
+const PROVIDERS = [
+  'UNCF', 'Hispanic Scholarship Fund', 'APIA Scholars', 'American Indian College Fund',
+  'STEM Education Foundation', 'Community Leaders Foundation', 'Innovation Hub'
+];
+
+const { random, pick } = createRandom(42);
+const randomName = (): string => {
+  const letters = 'abcdefghijklmnopqrstuvwxyz';
+  let name = letters[Math.floor(random() * 26)].toUpperCase();
+  for (let i = 0; i < 6; i++) name += letters[Math.floor(random() * 26)];
+  return name;
+};
+
+const makeScholarship = (i: number) => ({
+  id: `scholarship-${i}`,
+  title: `${randomName()} ${randomName()} ${pick(WORDS)} Scholarship`,
+  provider: pick(PROVIDERS),
+  amount: `$${(Math.floor(random() * 20) + 1) * 500}`,
+  deadline: new Date(2026, Math.floor(random() * 12), Math.floor(random() * 28) + 1),
+  applicationUrl: `https://example.org/scholarships/${i}`,
+});
+
+const heapUsed = (): number => {
+  if (global.gc) global.gc();
+  return process.memoryUsage().heapUsed;
+};
+
+function benchmark(size: number): void {
+  const index = new DuplicateIndexService();
+  const records = [];
+  for (let i = 0; i < size; i++) {
+    records.push(makeScholarship(i));
+  }
+
+  const heapBefore = heapUsed();
+  const loadStart = process.hrtime.bigint();
+  for (const record of records) {
+    index.add(record.id, record);
+  }
+  const loadMs = Number(process.hrtime.bigint() - loadStart) / 1e6;
+  const indexBytes = heapUsed() - heapBefore;
+
+  // Half the queries are perturbed copies of indexed records, half are new
+  const queries = [];
+  for (let q = 0; q < QUERY_COUNT; q++) {
+    const base = records[Math.floor(random() * size)];
+    queries.push(q % 2 === 0
+      ? { ...base, title: `${base.title} 2026`, applicationUrl: `https://www.example.org/apply/${base.id}` }
+      : makeScholarship(size + q));
+  }
+
+  let found = 0;
+  const queryHeapBefore = process.memoryUsage().heapUsed;
+  const queryStart = process.hrtime.bigint();
+  for (const query of queries) {
+    if (index.findDuplicates(query).length > 0) found++;
+  }
+  const queryMs = Number(process.hrtime.bigint() - queryStart) / 1e6;
+  const queryBytes = Math.max(0, process.memoryUsage().heapUsed - queryHeapBefore);
+
+  console.log(`📊 ${size.toLocaleString()} records`);
+  console.log(`   Load: ${loadMs.toFixed(0)}ms (${(loadMs * 1000 / size).toFixed(1)}µs/record)`);
+  console.log(`   Index memory: ${(indexBytes / 1024 / 1024).toFixed(1)}MB (${(indexBytes / size).toFixed(0)}B/record)`);
+  console.log(`   Query latency: ${(queryMs * 1000 / QUERY_COUNT).toFixed(1)}µs avg over ${QUERY_COUNT} queries`);
+  console.log(`   Query memory: ${(queryBytes / QUERY_COUNT / 1024).toFixed(1)}KB/query`);
+  console.log(`   Duplicates found: ${found}/${QUERY_COUNT / 2} expected\n`);
+}
+
+const sizes = process.argv.slice(2).map(Number).filter(n => n > 0);
+for (const size of sizes.length > 0 ? sizes : [10_000, 100_000, 1_000_000]) {
+  benchmark(size);
+}
@@ -0,0 +1,86 @@
+#!/usr/bin/env node
+
+/**
+ * Benchmark batch normalization against the per-item path.
+ *
+ * Usage: ts-node scripts/benchmark-normalization.ts [records]
+ * Defaults to 100k synthetic scraped items.
+ */
+
+import {
+  QUALITY_FIELDS,
+  QualityReport,
+  normalizeBatch,
+  normalizeList,
+  parseAmountRange,
+  parseDeadline,
+} from '../src/utils/normalization';
+import { createRandom } from './random';
+
+const AMOUNTS = ['$5,000', 'up to $10k', 'varies', '$1,000 - $2,500', '$500', 'Full tuition', '$2,000 per year', 'Not available'];
+const DEADLINES = ['2026-03-01', '03/15/2026', 'March 31, 2026', 'Apr 1st, 2026', 'Rolling', 'Not available'];
+
+const { random, pick } = createRandom(7);
+
+const makeItem = (i: number) => ({
+  title: `Scholarship ${i}`,
+  description: random() > 0.2 ? 'Awarded to students with demonstrated need.' : '',
+  amount: pick(AMOUNTS),
+  // Vary the day so the deadline cache sees realistic repetition
+  deadline: random() > 0.5 ? `2026-${String(Math.floor(random() * 12) + 1).padStart(2, '0')}-${String(Math.floor(random() * 28) + 1).padStart(2, '0')}` : pick(DEADLINES),
+  provider: random() > 0.1 ? 'Example Foundation' : 'Not available',
+  applicationUrl: random() > 0.3 ? `https://example.org/${i}` : '',
+  eligibility: ' Undergraduate ,  GPA 3.0+ ,, US citizen ',
+  requirements: 'Essay; Transcript; ',
+});
+
+/**
+ * Per-item path: every value is parsed independently and quality is
+ * scored one item at a time
+ */
+const normalizePerItem = (items: any[]): QualityReport => {
+  const report: QualityReport = { high_quality: 0, medium_quality: 0, low_quality: 0 };
+
+  for (const item of items) {
+    parseAmountRange(item.amount);
+    parseDeadline(item.deadline);
+    normalizeList(item.eligibility);
+    normalizeList(item.requirements);
+
+    const presentFields = QUALITY_FIELDS.filter(field =>
+      item[field] && item[field] !== 'Not available' && item[field].trim() !== ''
+    ).length;
+
+    if (presentFields >= 5) {
+      report.high_quality++;
+    } else if (presentFields >= 3) {
+      report.medium_quality++;
+    } else {
+      report.low_quality++;
+    }
+  }
+
+  return report;
+};
+
+const time = <T>(fn: () => T): { result: T; ms: number } => {
+  const start = process.hrtime.bigint();
+  const result = fn();
+  return { result, ms: Number(process.hrtime.bigint() - start) / 1e6 };
+};
+
+const size = Number(process.argv[2]) || 100_000;
+const items = Array.from({ length: size }, (_, i) => makeItem(i));
+
+// Warm up both paths before measuring
+normalizePerItem(items.slice(0, 1000));
+normalizeBatch(items.slice(0, 1000));
+
+const perItem = time(() => normalizePerItem(items));
+const batch = time(() => normalizeBatch(items));
+
+console.log(`📊 ${size.toLocaleString()} records`);
+console.log(`   Per-item: ${perItem.ms.toFixed(0)}ms (${(size / perItem.ms * 1000).toFixed(0)} items/s)`);
+console.log(`   Batch:    ${batch.ms.toFixed(0)}ms (${(size / batch.ms * 1000).toFixed(0)} items/s)`);
+console.log(`   Speed-up: ${(perItem.ms / batch.ms).toFixed(2)}x`);
+console.log(`   Quality tiers match: ${JSON.stringify(perItem.result) === JSON.stringify(batch.result.qualityReport)}`);
@@ -0,0 +1,17 @@
+/**
+ * Seeded random helpers for the benchmark scripts.
+ */
+
+/**
+ * Deterministic pseudo-random generator so runs are comparable
+ */
+export const createRandom = (seed: number) => {
+  let state = seed;
+  const random = (): number => {
+    state = (Math.imul(state, 1664525) + 1013904223) >>> 0;
+    return state / 0x100000000;
+  };
+  const pick = <T>(items: T[]): T => items[Math.floor(random() * items.length)];
+
+  return { random, pick };
+};
@@ -13,6 +13,8 @@ import { authenticateToken, authorize, optionalAuth } from './middleware/auth';
 import { 
   validateScholarship, 
   validateUpdateScholarship, 
+  validateBatchUpsert,
+  validateCheckDuplicates,
   validateLogin, 
   validateCreateUser, 
   handleValidationErrors 
@@ -25,6 +27,8 @@ import { ScholarshipAgentController } from './controllers/scholarshipAgentContro
 
 // Import services
 import { googleSheetsService } from './services/googleSheetsService';
+import { auditService } from './services/auditService';
+import { duplicateIndexService } from './services/duplicateIndexService';
 
 const app = express();
 const PORT = process.env.PORT || 5000;
@@ -180,6 +184,24 @@ app.post('/api/admin/scholarships/bulk-update',
   scholarshipController.bulkUpdateScholarships
 );
 
+app.post('/api/admin/scholarships/batch-upsert',
+  authenticateToken,
+  authorize('super_admin', 'admin'),
+  scholarshipWriteLimiter,
+  validateBatchUpsert,
+  handleValidationErrors,
+  scholarshipController.batchUpsertScholarships
+);
+
+// Duplicate detection against existing scholarships
+app.post('/api/admin/scholarships/check-duplicates',
+  authenticateToken,
+  authorize('super_admin', 'admin', 'editor'),
+  validateCheckDuplicates,
+  handleValidationErrors,
+  scholarshipController.checkDuplicates
+);
+
 // ============================================================================
 // ADMIN ANALYTICS ROUTES
 // ============================================================================
@@ -208,7 +230,7 @@ app.get('/api/admin/agent/status',
   authorize('super_admin', 'admin', 'editor', 'viewer'),
   async (req, res) => {
     try {
-      const status = scholarshipAgentController.getAgentStatus();
+      const status = await scholarshipAgentController.getAgentStatus();
       res.json({
         success: true,
         data: status
@@ -223,16 +245,66 @@ app.get('/api/admin/agent/status',
   }
 );
 
-// Run scholarship discovery
+// Get discovery run statistics from the run index
+app.get('/api/admin/agent/statistics',
+  authenticateToken,
+  authorize('super_admin', 'admin', 'editor', 'viewer'),
+  async (req, res) => {
+    try {
+      const days = parseInt(req.query.days as string) || 30;
+      const statistics = await auditService.getAgentStatistics(days);
+      res.json({
+        success: true,
+        data: statistics
+      });
+    } catch (error) {
+      console.error('Error getting agent statistics:', error);
+      res.status(500).json({
+        success: false,
+        message: 'Failed to get agent statistics'
+      });
+    }
+  }
+);
+
+// Get metrics from the last discovery run (?format=prometheus for text exposition)
+app.get('/api/admin/agent/metrics',
+  authenticateToken,
+  authorize('super_admin', 'admin', 'editor', 'viewer'),
+  (req, res) => {
+    try {
+      if (req.query.format === 'prometheus') {
+        res.type('text/plain; version=0.0.4');
+        res.send(scholarshipAgentController.getLastRunMetrics('prometheus'));
+        return;
+      }
+
+      res.json({
+        success: true,
+        data: scholarshipAgentController.getLastRunMetrics()
+      });
+    } catch (error) {
+      console.error('Error getting agent metrics:', error);
+      res.status(500).json({
+        success: false,
+        message: 'Failed to get agent metrics'
+      });
+    }
+  }
+);
+
 app.post('/api/admin/agent/discover',
   authenticateToken,
   authorize('super_admin', 'admin', 'editor'),
   async (req, res) => {
     try {
-      const { searchCriteria } = req.body;
+      const { searchCriteria, fullCrawl, profile } = req.body;
       console.log('Starting scholarship discovery via API...');
       
-      const result = await scholarshipAgentController.runDiscovery(searchCriteria);
+      const result = await scholarshipAgentController.runDiscovery(searchCriteria, {
+        fullCrawl: fullCrawl === true,
+        profile: profile === true
+      });
       
       if (result.success) {
         res.json({
@@ -240,7 +312,15 @@ app.post('/api/admin/agent/discover',
           message: 'Scholarship discovery completed',
           data: {
             scholarships_discovered: result.scholarships_discovered,
-            scholarships_saved: result.scholarships_saved
+            scholarships_saved: result.scholarships_saved,
+            sources_count: result.sources_count,
+            duration_seconds: result.duration_seconds,
+            sources: result.sources,
+            pages_new: result.pages_new,
+            pages_changed: result.pages_changed,
+            pages_unchanged: result.pages_unchanged,
+            llm_cache: result.llm_cache,
+            metrics: result.metrics
           }
         });
       } else {
@@ -294,6 +374,9 @@ const startServer = async () => {
     await googleSheetsService.initializeSheets();
     console.log('Google Sheets initialized successfully');
 
+    // Load the duplicate index in the background and keep it in sync
+    duplicateIndexService.startSync(() => googleSheetsService.fetchScholarships());
+
     // Start server
     app.listen(PORT, () => {
       console.log(`🚀 Scholarship Admin API server running on port ${PORT}`);
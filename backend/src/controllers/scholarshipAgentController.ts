@@ -2,6 +2,25 @@ import { spawn } from 'child_process';
 import path from 'path';
 import fs from 'fs';
 import { auditService } from '../services/auditService';
+import { agentRunIndexService } from '../services/agentRunIndexService';
+import { NormalizationReport, QualityReport } from '../utils/normalization';
+import { readRunOutput } from '../utils/agentOutput';
+import { AgentMetrics, formatPrometheusMetrics, getSlowestStage } from '../utils/metrics';
+
+interface SourceResult {
+  source: string;
+  scholarships_discovered?: number;
+  pages_fetched?: number;
+  duration_seconds?: number;
+  error?: string;
+}
+
+interface LlmCacheStats {
+  hits: number;
+  misses: number;
+  hit_rate: number;
+  tokens_saved: number;
+}
 
 interface AgentResult {
   success: boolean;
@@ -12,30 +31,141 @@ interface AgentResult {
   timestamp?: string;
   duration_seconds?: number;
   sources_count?: number;
+  sources?: SourceResult[];
+  pages_new?: number;
+  pages_changed?: number;
+  pages_unchanged?: number;
+  llm_cache?: LlmCacheStats;
+  metrics?: AgentMetrics;
   pipeline_type?: string;
   save_error?: string;
   sample_scholarships?: any[];
   error?: string;
   output?: string;
-  quality_report?: {
-    high_quality: number;
-    medium_quality: number;
-    low_quality: number;
-  };
+  quality_report?: QualityReport;
+  normalization_report?: NormalizationReport;
+}
+
+const AGENT_PROBE_TIMEOUT_MS = 10 * 1000;
+const AGENT_PROBE_RETRY_MS = 5 * 60 * 1000;
+
+interface DiscoveryOptions {
+  fullCrawl?: boolean;
+  profile?: boolean;
 }
 
 export class ScholarshipAgentController {
   private agentPath: string;
+  private inFlightRuns = new Map<string, Promise<AgentResult>>();
+  private agentFlags: Promise<Set<string>> | null = null;
+  private agentFlagsExpireAt = 0;
+  private knownAgentFlags: Set<string> | null = null;
+  private lastRunMetrics: { metrics: AgentMetrics; duration_seconds?: number } | null = null;
 
   constructor() {
     this.agentPath = path.join(__dirname, '../../langgraph-agent/backend/run_agent.py');
   }
 
   /**
-   * Run the scholarship discovery agent with enhanced JSON-first pipeline
+   * Run the scholarship discovery agent with enhanced JSON-first pipeline.
+   * Concurrent requests for the same criteria share a single agent process
+   * instead of each paying the Python start-up cost.
+   */
+  async runDiscovery(searchCriteria?: string, options: DiscoveryOptions = {}): Promise<AgentResult> {
+    // Structured key so runs with different agent args never share a process
+    const runKey = JSON.stringify([searchCriteria ?? null, !!options.fullCrawl, !!options.profile]);
+    const inFlight = this.inFlightRuns.get(runKey);
+    if (inFlight) {
+      console.log(`🔁 Joining in-flight discovery run for criteria: "${searchCriteria || 'default'}"`);
+      return inFlight;
+    }
+
+    const run = this.spawnDiscovery(searchCriteria, options).finally(() => {
+      this.inFlightRuns.delete(runKey);
+    });
+    this.inFlightRuns.set(runKey, run);
+    return run;
+  }
+
+  /**
+   * Detect the optional flags the installed agent accepts by reading its
+   * --help output once, so newer options are only passed to agents that
+   * understand them. A probe that fails or times out resolves to no flags
+   * and is retried after AGENT_PROBE_RETRY_MS.
+   */
+  private getAgentFlags(): Promise<Set<string>> {
+    if (!this.agentFlags || Date.now() >= this.agentFlagsExpireAt) {
+      this.agentFlagsExpireAt = Infinity;
+      this.agentFlags = new Promise((resolve) => {
+        const helpProcess = spawn('python3', [this.agentPath, '--help'], {
+          cwd: path.dirname(this.agentPath),
+          stdio: ['ignore', 'pipe', 'ignore']
+        });
+
+        let settled = false;
+        const settle = (flags: Set<string> | null) => {
+          if (settled) return;
+          settled = true;
+          clearTimeout(timer);
+
+          if (flags) {
+            this.knownAgentFlags = flags;
+          } else {
+            this.agentFlagsExpireAt = Date.now() + AGENT_PROBE_RETRY_MS;
+          }
+          resolve(flags || new Set());
+        };
+
+        const timer = setTimeout(() => {
+          console.warn(`Agent --help did not exit within ${AGENT_PROBE_TIMEOUT_MS / 1000}s, killing it`);
+          helpProcess.kill('SIGKILL');
+          settle(null);
+        }, AGENT_PROBE_TIMEOUT_MS);
+
+        let helpText = '';
+        helpProcess.stdout.on('data', (data) => {
+          helpText += data.toString();
+        });
+
+        helpProcess.on('close', (code) => {
+          if (settled) return;
+          if (code !== 0) {
+            console.warn(`Agent --help exited with code ${code}`);
+            settle(null);
+            return;
+          }
+          settle(new Set(helpText.match(/--[a-z][a-z-]*/g) || []));
+        });
+
+        helpProcess.on('error', (error) => {
+          console.warn('Failed to read agent options:', error.message);
+          settle(null);
+        });
+      });
+    }
+    return this.agentFlags;
+  }
+
+  /**
+   * Spawn a single agent process and collect its results
    */
-  async runDiscovery(searchCriteria?: string): Promise<AgentResult> {
+  private async spawnDiscovery(searchCriteria: string | undefined, options: DiscoveryOptions): Promise<AgentResult> {
     const finalSearchCriteria = searchCriteria || "new scholarships for college students 2025";
+    const agentFlags = await this.getAgentFlags();
+
+    if (options.fullCrawl && !agentFlags.has('--full')) {
+      return {
+        success: false,
+        error: 'The installed scholarship agent does not support full crawls (--full)'
+      };
+    }
+
+    if (options.profile && !agentFlags.has('--profile')) {
+      return {
+        success: false,
+        error: 'The installed scholarship agent does not support profiling (--profile)'
+      };
+    }
     
     // Log agent start
     auditService.logAgentStart(finalSearchCriteria).catch(error => 
@@ -48,14 +178,44 @@ export class ScholarshipAgentController {
         args.push('--search', searchCriteria);
       }
 
-      // Add timestamp for output file
+      // Bypass the agent's crawl-state store and refetch every page; only
+      // reached when the agent advertises --full
+      if (options.fullCrawl) {
+        args.push('--full');
+      }
+
+      // Opt-in cProfile output for the slowest pipeline stage; only reached
+      // when the agent advertises --profile
+      if (options.profile) {
+        args.push('--profile');
+      }
+
+      // Optional process pool for HTML parsing; the agent parses inline when
+      // unset or when it does not advertise --parse-workers
+      const parseWorkers = parseInt(process.env.AGENT_PARSE_WORKERS || '0');
+      if (parseWorkers > 0) {
+        if (agentFlags.has('--parse-workers')) {
+          args.push('--parse-workers', String(parseWorkers));
+        } else {
+          console.warn('⚠️  AGENT_PARSE_WORKERS is set but the installed agent does not support --parse-workers, parsing inline');
+        }
+      }
+
+      // Add timestamp for output file. Agents that support it stream one JSON
+      // record per line (items, then a summary trailer); older agents write
+      // a single JSON document.
+      const streamOutput = agentFlags.has('--output-format');
       const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
-      const outputFile = path.join(__dirname, `../../langgraph-agent/backend/logs/discovery_${timestamp}.json`);
+      const outputFile = path.join(__dirname, `../../langgraph-agent/backend/logs/discovery_${timestamp}.${streamOutput ? 'ndjson' : 'json'}`);
       args.push('--output', outputFile);
+      if (streamOutput) {
+        args.push('--output-format', 'ndjson');
+      }
 
       console.log(`🚀 Running enhanced scholarship agent with args: ${args.join(' ')}`);
       console.log(`📂 Output file: ${outputFile}`);
 
+      const startedAt = Date.now();
       const pythonProcess = spawn('python3', [this.agentPath, ...args], {
         cwd: path.dirname(this.agentPath),
         stdio: ['pipe', 'pipe', 'pipe']
@@ -78,37 +238,68 @@ export class ScholarshipAgentController {
         console.error('Agent stderr:', data.toString());
       });
 
-      pythonProcess.on('close', (code) => {
+      pythonProcess.on('close', async (code) => {
+        const processSeconds = (Date.now() - startedAt) / 1000;
         console.log(`🏁 Scholarship agent process finished with code: ${code}`);
         
         if (code === 0) {
           // Try to read the output file for detailed results
           try {
             if (fs.existsSync(outputFile)) {
-              const resultData = JSON.parse(fs.readFileSync(outputFile, 'utf-8'));
+              const readStartedAt = Date.now();
+              const runOutput = await readRunOutput(outputFile);
+              const resultData = runOutput.summary;
+              const metrics: AgentMetrics = {
+                ...(resultData.metrics || {}),
+                backend: {
+                  process_seconds: processSeconds,
+                  output_read_seconds: (Date.now() - readStartedAt) / 1000
+                }
+              };
               
               // Enhanced result with new JSON pipeline data
               const enhancedResult: AgentResult = {
                 success: resultData.success || true,
-                scholarships_discovered: resultData.scholarships_discovered || 0,
+                // Fall back to the item count when the summary trailer is missing
+                scholarships_discovered: resultData.scholarships_discovered ?? runOutput.item_count,
                 scholarships_saved: resultData.scholarships_saved || 0,
                 scholarships_skipped: resultData.scholarships_skipped || 0,
                 search_criteria: resultData.search_criteria,
                 timestamp: resultData.timestamp,
                 duration_seconds: resultData.duration_seconds,
                 sources_count: resultData.sources_count,
+                sources: Array.isArray(resultData.sources) ? resultData.sources : undefined,
+                pages_new: resultData.pages_new,
+                pages_changed: resultData.pages_changed,
+                pages_unchanged: resultData.pages_unchanged,
+                llm_cache: resultData.llm_cache,
+                metrics,
                 pipeline_type: resultData.pipeline_type || "JSON-first enhanced pipeline",
                 save_error: resultData.save_error,
-                sample_scholarships: resultData.sample_scholarships,
-                output: stdout
+                sample_scholarships: resultData.sample_scholarships || runOutput.sample_scholarships,
+                output: stdout,
+                quality_report: runOutput.quality_report,
+                normalization_report: runOutput.normalization_report
               };
               
-              // Add quality report if scholarships are present
-              if (resultData.scholarships && Array.isArray(resultData.scholarships)) {
-                enhancedResult.quality_report = this.generateQualityReport(resultData.scholarships);
-              }
+              this.recordRun(enhancedResult, runOutput.items_by_source, outputFile);
+              this.lastRunMetrics = { metrics, duration_seconds: enhancedResult.duration_seconds };
               
               console.log(`📊 Discovery completed: ${enhancedResult.scholarships_discovered} found, ${enhancedResult.scholarships_saved} saved`);
+              const slowestStage = getSlowestStage(metrics);
+              if (slowestStage) {
+                console.log(`⏱️  Slowest stage: ${slowestStage.stage} (${slowestStage.total_seconds.toFixed(1)}s)${metrics.profile_file ? `, profile: ${metrics.profile_file}` : ''}`);
+              }
+              if (enhancedResult.normalization_report) {
+                const normalization = enhancedResult.normalization_report;
+                console.log(`🧹 Normalized: ${normalization.with_amount} with amounts, ${normalization.with_deadline} with deadlines (${normalization.expired} expired)`);
+              }
+              if (enhancedResult.llm_cache) {
+                console.log(`🧠 LLM cache: ${(enhancedResult.llm_cache.hit_rate * 100).toFixed(1)}% hit rate, ${enhancedResult.llm_cache.tokens_saved} tokens saved`);
+              }
+              for (const source of enhancedResult.sources || []) {
+                console.log(`   • ${source.source}: ${source.scholarships_discovered || 0} found in ${(source.duration_seconds || 0).toFixed(1)}s${source.error ? ` (error: ${source.error})` : ''}`);
+              }
               
               // Log agent completion (non-blocking)
               auditService.logAgentCompletion(enhancedResult).catch(auditError => {
@@ -126,6 +317,7 @@ export class ScholarshipAgentController {
               resolve(enhancedResult);
             } else {
               console.log('⚠️  No output file found, returning basic success');
+              this.recordRun({ success: true, search_criteria: finalSearchCriteria });
               
               // Log completion without detailed results
               auditService.logAgentCompletion({ success: true }).catch(error => 
@@ -139,6 +331,11 @@ export class ScholarshipAgentController {
             }
           } catch (error) {
             console.error('❌ Error parsing result file:', error);
+            this.recordRun({
+              success: false,
+              search_criteria: finalSearchCriteria,
+              error: `Could not parse result file: ${error}`
+            }, {}, outputFile);
             
             // Log agent failure
             auditService.logAgentCompletion({ 
@@ -156,6 +353,11 @@ export class ScholarshipAgentController {
           }
         } else {
           console.error(`❌ Agent failed with exit code ${code}`);
+          this.recordRun({
+            success: false,
+            search_criteria: finalSearchCriteria,
+            error: `Agent failed with exit code ${code}`
+          });
           
           // Log agent failure
           auditService.logAgentCompletion({ 
@@ -175,6 +377,11 @@ export class ScholarshipAgentController {
 
       pythonProcess.on('error', (error) => {
         console.error('💥 Failed to start agent:', error);
+        this.recordRun({
+          success: false,
+          search_criteria: finalSearchCriteria,
+          error: `Failed to start agent: ${error.message}`
+        });
         
         // Log agent failure
         auditService.logAgentCompletion({ 
@@ -193,27 +400,36 @@ export class ScholarshipAgentController {
   }
 
   /**
-   * Generate quality report for discovered scholarships
+   * Append a run summary to the run index (non-blocking)
    */
-  private generateQualityReport(scholarships: any[]): { high_quality: number; medium_quality: number; low_quality: number } {
-    const report = { high_quality: 0, medium_quality: 0, low_quality: 0 };
-    
-    for (const scholarship of scholarships) {
-      const requiredFields = ['title', 'description', 'amount', 'deadline', 'provider', 'applicationUrl'];
-      const presentFields = requiredFields.filter(field => 
-        scholarship[field] && scholarship[field] !== 'Not available' && scholarship[field].trim() !== ''
-      ).length;
-      
-      if (presentFields >= 5) {
-        report.high_quality++;
-      } else if (presentFields >= 3) {
-        report.medium_quality++;
-      } else {
-        report.low_quality++;
-      }
+  private recordRun(result: AgentResult, itemsBySource: Record<string, number> = {}, outputFile?: string): void {
+    agentRunIndexService.recordRun({
+      timestamp: result.timestamp || new Date().toISOString(),
+      success: result.success,
+      search_criteria: result.search_criteria,
+      scholarships_discovered: result.scholarships_discovered || 0,
+      scholarships_saved: result.scholarships_saved || 0,
+      scholarships_skipped: result.scholarships_skipped || 0,
+      duration_seconds: result.duration_seconds || 0,
+      items_by_source: itemsBySource,
+      output_file: outputFile ? path.basename(outputFile) : undefined,
+      error: result.error
+    }).catch(error => {
+      console.warn('Failed to record run in index:', error);
+    });
+  }
+
+  /**
+   * Get metrics from the last completed run, as JSON or Prometheus text
+   */
+  getLastRunMetrics(format: 'json' | 'prometheus' = 'json'): AgentMetrics | string | null {
+    if (!this.lastRunMetrics) {
+      return format === 'prometheus' ? '' : null;
     }
-    
-    return report;
+
+    return format === 'prometheus'
+      ? formatPrometheusMetrics(this.lastRunMetrics.metrics, this.lastRunMetrics.duration_seconds)
+      : this.lastRunMetrics.metrics;
   }
 
   /**
@@ -246,22 +462,30 @@ export class ScholarshipAgentController {
   /**
    * Get agent status and recent runs
    */
-  getAgentStatus() {
+  async getAgentStatus() {
     const config = this.checkConfiguration();
     const logsDir = path.join(path.dirname(this.agentPath), 'logs');
-    
-    let recentRuns: string[] = [];
-    if (fs.existsSync(logsDir)) {
-      recentRuns = fs.readdirSync(logsDir)
-        .filter(file => file.startsWith('discovery_') && file.endsWith('.json'))
-        .sort()
-        .reverse()
-        .slice(0, 5);
+    const recentRuns = await agentRunIndexService.getRecentRuns(5);
+
+    // Report what the last successful probe found instead of waiting on a
+    // probe; start one in the background so the next call can answer
+    const agentFlags = this.knownAgentFlags;
+    if (!agentFlags) {
+      void this.getAgentFlags();
     }
+    const supports = (flag: string) => agentFlags ? agentFlags.has(flag) : null;
 
     return {
       ...config,
       agent_path: this.agentPath,
+      supports_full_crawl: supports('--full'),
+      supports_profile: supports('--profile'),
+      supports_ndjson_output: supports('--output-format'),
+      supports_parse_workers: supports('--parse-workers'),
+      active_runs: Array.from(this.inFlightRuns.keys()).map(key => {
+        const [searchCriteria, fullCrawl, profile] = JSON.parse(key);
+        return { search_criteria: searchCriteria, full_crawl: fullCrawl, profile };
+      }),
       recent_runs: recentRuns,
       logs_directory: logsDir
     };
@@ -9,6 +9,15 @@ import {
   AnalyticsData
 } from '../types/scholarship';
 import { googleSheetsService } from '../services/googleSheetsService';
+import { duplicateIndexService } from '../services/duplicateIndexService';
+import { validateScholarshipData } from '../utils/validation';
+
+const SCHOLARSHIP_STATUSES = ['draft', 'active', 'inactive'];
+
+const asString = (value: unknown): string => (typeof value === 'string' ? value : '');
+
+const asStringList = (value: unknown): string[] =>
+  Array.isArray(value) ? value.filter((item): item is string => typeof item === 'string') : [];
 
 /**
  * Get all scholarships with filtering and pagination
@@ -208,6 +217,7 @@ export const createScholarship = async (req: Request, res: Response): Promise<vo
     };
 
     const scholarshipId = await googleSheetsService.createScholarship(newScholarship, userEmail);
+    duplicateIndexService.add(scholarshipId, newScholarship);
 
     res.status(201).json({
       success: true,
@@ -249,7 +259,10 @@ export const updateScholarship = async (req: Request, res: Response): Promise<vo
       scholarshipUpdates.isActive = updates.status !== 'inactive';
     }
 
-    await googleSheetsService.updateScholarship(id, scholarshipUpdates, userEmail);
+    const updatedScholarship = await googleSheetsService.updateScholarship(id, scholarshipUpdates, userEmail);
+    if (updatedScholarship) {
+      duplicateIndexService.add(id, updatedScholarship);
+    }
 
     res.json({
       success: true,
@@ -272,6 +285,8 @@ export const deleteScholarship = async (req: Request, res: Response): Promise<vo
     const { id } = req.params;
     const userEmail = req.user?.email || 'unknown';
 
+    // Soft deletes keep the row and its indexed fields, so the duplicate
+    // index is left as is
     await googleSheetsService.deleteScholarship(id, userEmail);
 
     res.json({
@@ -394,15 +409,12 @@ export const bulkUpdateScholarships = async (req: Request, res: Response): Promi
       return;
     }
 
-    const results = [];
-    for (const id of scholarshipIds) {
-      try {
-        await googleSheetsService.updateScholarship(id, updates, userEmail);
-        results.push({ id, success: true });
-      } catch (error) {
-        results.push({ id, success: false, error: error instanceof Error ? error.message : 'Unknown error' });
-      }
-    }
+    // Single sheet read and batched write instead of one lookup per ID
+    const writeResults = await googleSheetsService.bulkUpdateScholarships(scholarshipIds, updates, userEmail);
+    const results = writeResults.map(({ scholarship, ...result }) => {
+      if (scholarship) duplicateIndexService.add(scholarship.id, scholarship);
+      return result;
+    });
 
     const successCount = results.filter(r => r.success).length;
     const failureCount = results.length - successCount;
@@ -427,3 +439,151 @@ export const bulkUpdateScholarships = async (req: Request, res: Response): Promi
     });
   }
 };
+
+/**
+ * Insert or update many scholarships in a few batched sheet writes
+ */
+export const batchUpsertScholarships = async (req: Request, res: Response): Promise<void> => {
+  try {
+    const { scholarships } = req.body;
+    const userEmail = req.user?.email || 'unknown';
+
+    if (!Array.isArray(scholarships) || scholarships.length === 0) {
+      res.status(400).json({
+        success: false,
+        message: 'Scholarships array is required'
+      });
+      return;
+    }
+
+    // Validate each item so one bad row is reported instead of failing the batch
+    const items: (Omit<Scholarship, 'id'> & { id?: string })[] = [];
+    const invalid: { index: number; id?: string; title?: string; errors: string[] }[] = [];
+    const seenIds = new Set<string>();
+
+    scholarships.forEach((data: any, index: number) => {
+      if (!data || typeof data !== 'object') {
+        invalid.push({ index, errors: ['Scholarship must be an object'] });
+        return;
+      }
+
+      const status = data.status === undefined ? 'active' : data.status;
+      const item = {
+        ...(typeof data.id === 'string' && data.id ? { id: data.id } : {}),
+        title: asString(data.title),
+        description: asString(data.description),
+        amount: asString(data.amount),
+        deadline: new Date(asString(data.deadline)),
+        eligibility: asStringList(data.eligibility),
+        requirements: asStringList(data.requirements),
+        applicationUrl: asString(data.applicationUrl),
+        provider: asString(data.provider),
+        location: 'United States', // Fixed for US scholarships
+        category: asString(data.category),
+        isActive: status !== 'inactive',
+        status,
+      };
+
+      const errors = validateScholarshipData(item);
+      if (!SCHOLARSHIP_STATUSES.includes(status)) {
+        errors.push('Status must be one of: draft, active, inactive');
+      }
+      if (item.id && seenIds.has(item.id)) {
+        errors.push('ID appears more than once in the batch');
+      }
+
+      if (errors.length > 0) {
+        invalid.push({ index, id: item.id, title: item.title || undefined, errors });
+      } else {
+        items.push(item);
+        if (item.id) seenIds.add(item.id);
+      }
+    });
+
+    if (items.length === 0) {
+      res.status(400).json({
+        success: false,
+        message: 'No valid scholarships to upsert',
+        errors: invalid
+      });
+      return;
+    }
+
+    const { written, ...result } = await googleSheetsService.upsertScholarships(items, userEmail);
+    for (const scholarship of written) {
+      duplicateIndexService.add(scholarship.id, scholarship);
+    }
+
+    res.json({
+      success: true,
+      data: { ...result, invalid },
+      message: `Batch upsert completed: ${result.inserted.length} inserted, ${result.updated.length} updated, ${result.unchanged.length} unchanged, ${result.failed.length} failed, ${invalid.length} invalid`
+    });
+  } catch (error) {
+    console.error('Batch upsert error:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Failed to batch upsert scholarships'
+    });
+  }
+};
+
+/**
+ * Check candidate scholarships against existing ones for likely duplicates
+ */
+export const checkDuplicates = async (req: Request, res: Response): Promise<void> => {
+  try {
+    const { scholarships, threshold } = req.body;
+
+    if (!Array.isArray(scholarships) || scholarships.length === 0) {
+      res.status(400).json({
+        success: false,
+        message: 'Scholarships array is required'
+      });
+      return;
+    }
+
+    // The index is synced on a schedule and updated in place on writes;
+    // only the first request after start-up waits for the initial load
+    if (!duplicateIndexService.isReady && !(await duplicateIndexService.refresh())) {
+      res.status(503).json({
+        success: false,
+        message: 'Duplicate index is not available yet'
+      });
+      return;
+    }
+
+    const results = scholarships.map((candidate: CreateScholarshipRequest) => {
+      const matches = duplicateIndexService.findDuplicates(
+        candidate,
+        typeof threshold === 'number' ? threshold : undefined
+      );
+
+      return {
+        title: candidate.title,
+        isDuplicate: matches.length > 0,
+        matches
+      };
+    });
+
+    const duplicateCount = results.filter(r => r.isDuplicate).length;
+
+    res.json({
+      success: true,
+      data: {
+        results,
+        summary: {
+          total: results.length,
+          duplicates: duplicateCount,
+          unique: results.length - duplicateCount
+        }
+      }
+    });
+  } catch (error) {
+    console.error('Check duplicates error:', error);
+    res.status(500).json({
+      success: false,
+      message: 'Failed to check duplicates'
+    });
+  }
+};
@@ -141,6 +141,40 @@ export const validateCreateUser: ValidationChain[] = [
     .withMessage('Role must be one of: super_admin, admin, editor, viewer')
 ];
 
+/**
+ * Validation rules for batch upserts; items are validated one by one in
+ * the controller so a bad item does not reject the whole batch
+ */
+export const validateBatchUpsert: ValidationChain[] = [
+  body('scholarships')
+    .isArray({ min: 1, max: 5000 })
+    .withMessage('Scholarships must be an array of 1 to 5000 items')
+];
+
+/**
+ * Validation rules for duplicate checks
+ */
+export const validateCheckDuplicates: ValidationChain[] = [
+  body('scholarships')
+    .isArray({ min: 1, max: 5000 })
+    .withMessage('Scholarships must be an array of 1 to 5000 items'),
+  body('scholarships.*')
+    .isObject()
+    .withMessage('Each scholarship must be an object'),
+  body('scholarships.*.title')
+    .isString()
+    .withMessage('Each scholarship must have a title'),
+  body(['scholarships.*.provider', 'scholarships.*.amount', 'scholarships.*.applicationUrl', 'scholarships.*.deadline'])
+    .optional()
+    .isString()
+    .withMessage('Provider, amount, application URL and deadline must be strings'),
+  body('threshold')
+    .optional()
+    .isFloat({ min: 0, max: 1 })
+    .withMessage('Threshold must be a number between 0 and 1')
+    .toFloat()
+];
+
 /**
  * Validation rules for updating scholarships (partial)
  */
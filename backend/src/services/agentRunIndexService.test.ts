@@ -0,0 +1,73 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { AgentRunIndexService, AgentRunRecord } from './agentRunIndexService';
+
+const makeRun = (timestamp: string, overrides: Partial<AgentRunRecord> = {}): AgentRunRecord => ({
+  timestamp,
+  success: true,
+  scholarships_discovered: 10,
+  scholarships_saved: 8,
+  scholarships_skipped: 2,
+  duration_seconds: 30,
+  items_by_source: { fastweb: 10 },
+  ...overrides,
+});
+
+describe('AgentRunIndexService', () => {
+  let dir: string;
+  let service: AgentRunIndexService;
+
+  beforeEach(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'run-index-'));
+    service = new AgentRunIndexService(path.join(dir, 'logs', 'runs_index.ndjson'));
+    jest.spyOn(console, 'warn').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+    jest.restoreAllMocks();
+  });
+
+  it('returns no runs before the index exists', async () => {
+    await expect(service.getRuns()).resolves.toEqual([]);
+  });
+
+  it('appends runs one per line, creating the logs directory', async () => {
+    const first = makeRun('2026-01-01T00:00:00.000Z');
+    const second = makeRun('2026-01-02T00:00:00.000Z', { success: false, error: 'Agent crashed' });
+
+    await service.recordRun(first);
+    await service.recordRun(second);
+
+    expect(fs.readFileSync(service.path, 'utf-8').trim().split('\n')).toHaveLength(2);
+    await expect(service.getRuns()).resolves.toEqual([first, second]);
+  });
+
+  it('filters runs by age', async () => {
+    const old = makeRun(new Date(Date.now() - 10 * 24 * 60 * 60 * 1000).toISOString());
+    const recent = makeRun(new Date(Date.now() - 60 * 60 * 1000).toISOString());
+    await service.recordRun(old);
+    await service.recordRun(recent);
+
+    await expect(service.getRuns(7)).resolves.toEqual([recent]);
+  });
+
+  it('returns the most recent runs newest first', async () => {
+    const runs = ['01', '02', '03'].map(day => makeRun(`2026-01-${day}T00:00:00.000Z`));
+    for (const run of runs) {
+      await service.recordRun(run);
+    }
+
+    await expect(service.getRecentRuns(2)).resolves.toEqual([runs[2], runs[1]]);
+  });
+
+  it('skips malformed lines', async () => {
+    const run = makeRun('2026-01-01T00:00:00.000Z');
+    await service.recordRun(run);
+    fs.appendFileSync(service.path, '{"timestamp":"2026-01-02');
+
+    await expect(service.getRuns()).resolves.toEqual([run]);
+    expect(console.warn).toHaveBeenCalledTimes(1);
+  });
+});
@@ -0,0 +1,86 @@
+import fs from 'fs';
+import path from 'path';
+import readline from 'readline';
+
+/**
+ * Compact summary of a single discovery run
+ */
+export interface AgentRunRecord {
+  timestamp: string;
+  success: boolean;
+  search_criteria?: string;
+  scholarships_discovered: number;
+  scholarships_saved: number;
+  scholarships_skipped: number;
+  duration_seconds: number;
+  items_by_source: Record<string, number>;
+  output_file?: string;
+  error?: string;
+}
+
+/**
+ * Append-only index of discovery runs, one JSON record per line.
+ * Lets status and statistics queries read small per-run summaries instead
+ * of listing the logs directory and parsing every run output file.
+ */
+export class AgentRunIndexService {
+  constructor(private indexFile: string) {}
+
+  /**
+   * Path of the index file
+   */
+  get path(): string {
+    return this.indexFile;
+  }
+
+  /**
+   * Append a run to the index
+   */
+  async recordRun(record: AgentRunRecord): Promise<void> {
+    await fs.promises.mkdir(path.dirname(this.indexFile), { recursive: true });
+    await fs.promises.appendFile(this.indexFile, `${JSON.stringify(record)}\n`, 'utf-8');
+  }
+
+  /**
+   * Get runs in chronological order, optionally limited to the last N days
+   */
+  async getRuns(days?: number): Promise<AgentRunRecord[]> {
+    if (!fs.existsSync(this.indexFile)) {
+      return [];
+    }
+
+    const cutoff = days !== undefined ? Date.now() - days * 24 * 60 * 60 * 1000 : 0;
+    const runs: AgentRunRecord[] = [];
+    const lines = readline.createInterface({
+      input: fs.createReadStream(this.indexFile, { encoding: 'utf-8' }),
+      crlfDelay: Infinity,
+    });
+
+    for await (const line of lines) {
+      if (!line.trim()) continue;
+      try {
+        const record: AgentRunRecord = JSON.parse(line);
+        if (new Date(record.timestamp).getTime() >= cutoff) {
+          runs.push(record);
+        }
+      } catch (error) {
+        console.warn('Skipping malformed run index entry:', error);
+      }
+    }
+
+    return runs;
+  }
+
+  /**
+   * Get the most recent runs, newest first
+   */
+  async getRecentRuns(limit: number = 5): Promise<AgentRunRecord[]> {
+    const runs = await this.getRuns();
+    return runs.slice(-limit).reverse();
+  }
+}
+
+// Export singleton instance
+export const agentRunIndexService = new AgentRunIndexService(
+  path.join(__dirname, '../../langgraph-agent/backend/logs/runs_index.ndjson')
+);
@@ -1,5 +1,6 @@
 import { AuditAction } from '../types/scholarship';
 import { googleSheetsService } from './googleSheetsService';
+import { agentRunIndexService } from './agentRunIndexService';
 
 /**
  * Service for handling audit logging and activity tracking
@@ -225,18 +226,30 @@ class AuditService {
     total_scholarships_discovered: number;
     total_scholarships_saved: number;
     average_duration: number;
+    scholarships_by_source: Record<string, number>;
     recent_activities: any[];
   }> {
     try {
-      // This would ideally query an audit log database or sheet
-      // For now, we'll return basic statistics structure
+      const runs = await agentRunIndexService.getRuns(days);
+      const successfulRuns = runs.filter(run => run.success);
+
+      const scholarshipsBySource: Record<string, number> = {};
+      for (const run of runs) {
+        for (const [source, count] of Object.entries(run.items_by_source || {})) {
+          scholarshipsBySource[source] = (scholarshipsBySource[source] || 0) + count;
+        }
+      }
+
       return {
-        total_runs: 0,
-        successful_runs: 0,
-        total_scholarships_discovered: 0,
-        total_scholarships_saved: 0,
-        average_duration: 0,
-        recent_activities: []
+        total_runs: runs.length,
+        successful_runs: successfulRuns.length,
+        total_scholarships_discovered: runs.reduce((sum, run) => sum + run.scholarships_discovered, 0),
+        total_scholarships_saved: runs.reduce((sum, run) => sum + run.scholarships_saved, 0),
+        average_duration: successfulRuns.length > 0
+          ? successfulRuns.reduce((sum, run) => sum + run.duration_seconds, 0) / successfulRuns.length
+          : 0,
+        scholarships_by_source: scholarshipsBySource,
+        recent_activities: runs.slice(-10).reverse()
       };
     } catch (error) {
       console.error('Error getting agent statistics:', error);
@@ -316,17 +329,28 @@ class AuditService {
     scholarships_discovered?: number;
     scholarships_saved?: number;
     scholarships_skipped?: number;
+    pages_new?: number;
+    pages_changed?: number;
+    pages_unchanged?: number;
+    llm_cache?: { hit_rate: number; tokens_saved: number };
     duration_seconds?: number;
     error?: string;
   }): Promise<void> {
     try {
+      const pageSummary = result.pages_unchanged !== undefined
+        ? ` (pages: ${result.pages_new || 0} new, ${result.pages_changed || 0} changed, ${result.pages_unchanged} unchanged)`
+        : '';
+      const cacheSummary = result.llm_cache
+        ? ` (LLM cache: ${(result.llm_cache.hit_rate * 100).toFixed(1)}% hits, ${result.llm_cache.tokens_saved} tokens saved)`
+        : '';
+
       const action: AuditAction = {
         timestamp: new Date(),
         action: result.success ? 'agent_completed' : 'agent_failed',
         scholarshipId: 'system',
         userEmail: 'scholarship-agent@system',
         changesMade: result.success 
-          ? `Agent completed successfully: ${result.scholarships_discovered || 0} discovered, ${result.scholarships_saved || 0} saved, ${result.scholarships_skipped || 0} skipped in ${(result.duration_seconds || 0).toFixed(1)}s`
+          ? `Agent completed successfully: ${result.scholarships_discovered || 0} discovered, ${result.scholarships_saved || 0} saved, ${result.scholarships_skipped || 0} skipped in ${(result.duration_seconds || 0).toFixed(1)}s${pageSummary}${cacheSummary}`
           : `Agent failed: ${result.error || 'Unknown error'}`
       };
 
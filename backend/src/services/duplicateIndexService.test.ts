@@ -0,0 +1,125 @@
+import { DuplicateIndexService, canonicalizeUrl } from './duplicateIndexService';
+import { Scholarship } from '../types/scholarship';
+
+const makeScholarship = (id: string, overrides: Partial<Scholarship> = {}): Scholarship => ({
+  id,
+  title: 'Future Engineers STEM Scholarship',
+  description: 'Awarded to engineering students.',
+  amount: '$5,000',
+  deadline: new Date('2030-03-01'),
+  eligibility: ['Undergraduate'],
+  requirements: ['Essay'],
+  applicationUrl: `https://example.org/apply/${id}`,
+  provider: 'Example Engineering Foundation',
+  location: 'United States',
+  category: 'STEM',
+  isActive: true,
+  status: 'active',
+  ...overrides,
+});
+
+const unrelated = (id: string) => makeScholarship(id, {
+  title: 'Community Arts Leadership Award',
+  amount: '$750',
+  deadline: new Date('2030-11-15'),
+  provider: 'Riverside Arts Council',
+});
+
+describe('canonicalizeUrl', () => {
+  it.each([
+    ['https://www.Example.org/Apply/?utm_source=mail#top', 'example.org/apply'],
+    ['http://example.org/apply', 'example.org/apply'],
+    ['https://example.org/apply?b=2&a=1', 'example.org/apply?a=1&b=2'],
+    ['not a url', 'not a url'],
+    ['', ''],
+  ])('canonicalizes %j', (url, expected) => {
+    expect(canonicalizeUrl(url)).toBe(expected);
+  });
+});
+
+describe('DuplicateIndexService', () => {
+  let index: DuplicateIndexService;
+
+  beforeEach(() => {
+    index = new DuplicateIndexService();
+  });
+
+  it('matches near-duplicates with a similarity score', () => {
+    index.add('scholarship-2', makeScholarship('scholarship-2'));
+    index.add('scholarship-3', unrelated('scholarship-3'));
+
+    const matches = index.findDuplicates({
+      ...makeScholarship('candidate', { title: 'Future Engineers STEM Scholarship 2030' }),
+      applicationUrl: 'https://other.org/apply',
+    });
+
+    expect(matches).toHaveLength(1);
+    expect(matches[0].existingId).toBe('scholarship-2');
+    expect(matches[0].matchType).toBe('near_duplicate');
+    expect(matches[0].similarity).toBeGreaterThanOrEqual(0.75);
+  });
+
+  it('matches canonical application URLs exactly', () => {
+    index.add('scholarship-2', unrelated('scholarship-2'));
+
+    const [match] = index.findDuplicates({
+      ...makeScholarship('candidate'),
+      applicationUrl: 'https://www.example.org/apply/scholarship-2/?utm_campaign=x',
+    });
+
+    expect(match).toEqual({ existingId: 'scholarship-2', similarity: 1, matchType: 'url' });
+  });
+
+  it('keeps a URL match when one of several rows sharing it is removed', () => {
+    const url = 'https://example.org/apply/shared';
+    index.add('scholarship-2', unrelated('scholarship-2'));
+    index.add('scholarship-3', makeScholarship('scholarship-3', { applicationUrl: url }));
+    index.add('scholarship-4', unrelated('scholarship-4'));
+    index.add('scholarship-2', { ...unrelated('scholarship-2'), applicationUrl: url });
+    index.add('scholarship-4', { ...unrelated('scholarship-4'), applicationUrl: url });
+
+    index.remove('scholarship-3');
+    expect(index.findDuplicates({ ...makeScholarship('candidate'), applicationUrl: url })[0])
+      .toMatchObject({ existingId: 'scholarship-2', matchType: 'url' });
+
+    index.remove('scholarship-2');
+    expect(index.findDuplicates({ ...makeScholarship('candidate'), applicationUrl: url })[0])
+      .toMatchObject({ existingId: 'scholarship-4', matchType: 'url' });
+
+    index.remove('scholarship-4');
+    expect(index.findDuplicates({ ...unrelated('candidate'), applicationUrl: url })).toEqual([]);
+  });
+
+  it('re-indexes a scholarship when its fields change', () => {
+    index.add('scholarship-2', makeScholarship('scholarship-2'));
+    index.add('scholarship-2', unrelated('scholarship-2'));
+
+    expect(index.size).toBe(1);
+    expect(index.findDuplicates({ ...makeScholarship('candidate'), applicationUrl: '' })).toEqual([]);
+  });
+
+  it('applies the similarity threshold', () => {
+    index.add('scholarship-2', makeScholarship('scholarship-2'));
+    const candidate = {
+      ...makeScholarship('candidate', { title: 'Future Engineers STEM Award', amount: '$4,000' }),
+      applicationUrl: '',
+    };
+
+    const [match] = index.findDuplicates(candidate, 0);
+    expect(match.existingId).toBe('scholarship-2');
+    expect(index.findDuplicates(candidate, match.similarity)).toHaveLength(1);
+    expect(index.findDuplicates(candidate, Math.min(1, match.similarity + 0.01))).toEqual([]);
+  });
+
+  it('syncs to a new set of scholarships', () => {
+    expect(index.isReady).toBe(false);
+    index.sync([makeScholarship('scholarship-2'), unrelated('scholarship-3')]);
+    expect(index.isReady).toBe(true);
+
+    index.sync([unrelated('scholarship-3'), makeScholarship('scholarship-4')]);
+
+    expect(index.size).toBe(2);
+    const matches = index.findDuplicates({ ...makeScholarship('candidate'), applicationUrl: '' });
+    expect(matches.map(match => match.existingId)).toEqual(['scholarship-4']);
+  });
+});
@@ -0,0 +1,374 @@
+import { Scholarship } from '../types/scholarship';
+
+/**
+ * Fields used for duplicate detection
+ */
+export type DuplicateCandidate = Pick<Scholarship, 'title' | 'provider' | 'amount' | 'applicationUrl'> & {
+  deadline: Date | string;
+};
+
+export interface DuplicateMatch {
+  existingId: string;
+  similarity: number;
+  matchType: 'url' | 'near_duplicate';
+}
+
+interface IndexedEntry {
+  signature: Uint32Array;
+  urlKey: string;
+  fingerprint: string;
+}
+
+const NUM_HASHES = 120;
+const BAND_SIZE = 6;
+const NUM_BANDS = NUM_HASHES / BAND_SIZE;
+const SHINGLE_SIZE = 4;
+const DEFAULT_THRESHOLD = 0.75;
+const DEFAULT_SYNC_INTERVAL_MS = 15 * 60 * 1000;
+
+/**
+ * FNV-1a 32-bit string hash
+ */
+const hashString = (value: string): number => {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < value.length; i++) {
+    hash ^= value.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return hash >>> 0;
+};
+
+/**
+ * MurmurHash3 finalizer, used to derive independent hash functions from a seed
+ */
+const mix = (value: number): number => {
+  let h = value;
+  h ^= h >>> 16;
+  h = Math.imul(h, 0x85ebca6b);
+  h ^= h >>> 13;
+  h = Math.imul(h, 0xc2b2ae35);
+  h ^= h >>> 16;
+  return h >>> 0;
+};
+
+// Fixed seeds so signatures are stable across restarts
+const SEEDS = Array.from({ length: NUM_HASHES }, (_, i) => mix(0x9e3779b9 + i));
+
+const normalizeText = (value: string): string =>
+  (value || '').toLowerCase().replace(/[^a-z0-9]+/g, ' ').trim();
+
+/**
+ * Reduce an application URL to a canonical form so trivial variations
+ * (scheme, www, trailing slash, tracking params, fragments) hash the same
+ */
+export const canonicalizeUrl = (url: string): string => {
+  if (!url) return '';
+
+  try {
+    const parsed = new URL(url.trim());
+    const host = parsed.hostname.toLowerCase().replace(/^www\./, '');
+    const pathname = parsed.pathname.replace(/\/+$/, '').toLowerCase();
+    const params = Array.from(parsed.searchParams.entries())
+      .filter(([key]) => !key.toLowerCase().startsWith('utm_'))
+      .sort(([a], [b]) => a.localeCompare(b))
+      .map(([key, value]) => `${key}=${value}`)
+      .join('&');
+    return `${host}${pathname}${params ? `?${params}` : ''}`;
+  } catch {
+    return url.trim().toLowerCase();
+  }
+};
+
+const normalizeDeadline = (deadline: Date | string): string => {
+  const date = deadline instanceof Date ? deadline : new Date(deadline);
+  return isNaN(date.getTime()) ? '' : date.toISOString().split('T')[0];
+};
+
+/**
+ * Build the token set for a scholarship: character shingles of the title
+ * plus tagged provider words, amount digits and deadline
+ */
+const tokenize = (candidate: DuplicateCandidate): Set<number> => {
+  const tokens = new Set<number>();
+  const title = normalizeText(candidate.title);
+
+  if (title.length <= SHINGLE_SIZE) {
+    if (title) tokens.add(hashString(`t:${title}`));
+  } else {
+    for (let i = 0; i <= title.length - SHINGLE_SIZE; i++) {
+      tokens.add(hashString(`t:${title.substring(i, i + SHINGLE_SIZE)}`));
+    }
+  }
+
+  for (const word of normalizeText(candidate.provider).split(' ')) {
+    if (word) tokens.add(hashString(`p:${word}`));
+  }
+
+  const amount = (candidate.amount || '').replace(/[^0-9]/g, '');
+  if (amount) tokens.add(hashString(`a:${amount}`));
+
+  const deadline = normalizeDeadline(candidate.deadline);
+  if (deadline) tokens.add(hashString(`d:${deadline}`));
+
+  return tokens;
+};
+
+const computeSignature = (tokens: Set<number>): Uint32Array => {
+  const signature = new Uint32Array(NUM_HASHES).fill(0xffffffff);
+  for (const token of tokens) {
+    for (let i = 0; i < NUM_HASHES; i++) {
+      const value = mix(token ^ SEEDS[i]);
+      if (value < signature[i]) {
+        signature[i] = value;
+      }
+    }
+  }
+  return signature;
+};
+
+const computeBandKeys = (signature: Uint32Array): number[] => {
+  const keys: number[] = [];
+  for (let band = 0; band < NUM_BANDS; band++) {
+    let hash = band;
+    for (let row = 0; row < BAND_SIZE; row++) {
+      hash = mix(hash ^ signature[band * BAND_SIZE + row]);
+    }
+    keys.push(hash);
+  }
+  return keys;
+};
+
+const estimateSimilarity = (a: Uint32Array, b: Uint32Array): number => {
+  let equal = 0;
+  for (let i = 0; i < NUM_HASHES; i++) {
+    if (a[i] === b[i]) equal++;
+  }
+  return equal / NUM_HASHES;
+};
+
+/**
+ * Near-duplicate index over existing scholarships using MinHash signatures
+ * with LSH banding, plus exact matching on canonical application URLs.
+ * Queries only compare against scholarships sharing at least one LSH band,
+ * so lookup cost does not grow linearly with the size of the sheet.
+ */
+export class DuplicateIndexService {
+  private entries = new Map<string, IndexedEntry>();
+  private buckets: Map<number, string[]>[] = Array.from({ length: NUM_BANDS }, () => new Map());
+  // Several rows can share a canonical URL; the first indexed one is reported
+  private urlIndex = new Map<string, string[]>();
+  private loaded = false;
+  private loadScholarships: (() => Promise<Scholarship[]>) | null = null;
+  private syncTimer: NodeJS.Timeout | null = null;
+  private syncing: Promise<boolean> | null = null;
+  private resyncRequested = false;
+
+  /**
+   * Number of indexed scholarships
+   */
+  get size(): number {
+    return this.entries.size;
+  }
+
+  /**
+   * Whether the index has been loaded from a scholarship source
+   */
+  get isReady(): boolean {
+    return this.loaded;
+  }
+
+  /**
+   * Add or re-index a scholarship
+   */
+  add(id: string, candidate: DuplicateCandidate): void {
+    const fingerprint = this.fingerprint(candidate);
+    const existing = this.entries.get(id);
+    if (existing && existing.fingerprint === fingerprint) return;
+    if (existing) this.remove(id);
+
+    const signature = computeSignature(tokenize(candidate));
+    const bandKeys = computeBandKeys(signature);
+    const urlKey = canonicalizeUrl(candidate.applicationUrl);
+
+    bandKeys.forEach((key, band) => {
+      const bucket = this.buckets[band].get(key);
+      if (bucket) {
+        bucket.push(id);
+      } else {
+        this.buckets[band].set(key, [id]);
+      }
+    });
+
+    if (urlKey) {
+      const urlIds = this.urlIndex.get(urlKey);
+      if (urlIds) {
+        urlIds.push(id);
+      } else {
+        this.urlIndex.set(urlKey, [id]);
+      }
+    }
+
+    this.entries.set(id, { signature, urlKey, fingerprint });
+  }
+
+  /**
+   * Remove a scholarship from the index
+   */
+  remove(id: string): void {
+    const entry = this.entries.get(id);
+    if (!entry) return;
+
+    computeBandKeys(entry.signature).forEach((key, band) => {
+      const bucket = this.buckets[band].get(key);
+      if (!bucket) return;
+      const remaining = bucket.filter(existingId => existingId !== id);
+      if (remaining.length > 0) {
+        this.buckets[band].set(key, remaining);
+      } else {
+        this.buckets[band].delete(key);
+      }
+    });
+
+    const urlIds = entry.urlKey ? this.urlIndex.get(entry.urlKey) : undefined;
+    if (urlIds) {
+      const remaining = urlIds.filter(existingId => existingId !== id);
+      if (remaining.length > 0) {
+        this.urlIndex.set(entry.urlKey, remaining);
+      } else {
+        this.urlIndex.delete(entry.urlKey);
+      }
+    }
+
+    this.entries.delete(id);
+  }
+
+  /**
+   * Bring the index in line with the current scholarships, only hashing
+   * rows that are new or have changed since the last sync
+   */
+  sync(scholarships: Scholarship[]): void {
+    const seen = new Set<string>();
+    for (const scholarship of scholarships) {
+      seen.add(scholarship.id);
+      this.add(scholarship.id, scholarship);
+    }
+
+    for (const id of Array.from(this.entries.keys())) {
+      if (!seen.has(id)) this.remove(id);
+    }
+
+    this.loaded = true;
+  }
+
+  /**
+   * Keep the index in sync with a scholarship source: load it now and then
+   * re-sync on an interval. The source must throw on read errors so a
+   * failed read never replaces the index with fallback data.
+   */
+  startSync(load: () => Promise<Scholarship[]>, intervalMs: number = DEFAULT_SYNC_INTERVAL_MS): Promise<boolean> {
+    this.stopSync();
+    this.loadScholarships = load;
+    this.syncTimer = setInterval(() => this.refresh(), intervalMs);
+    this.syncTimer.unref();
+    return this.refresh();
+  }
+
+  /**
+   * Stop the periodic sync
+   */
+  stopSync(): void {
+    if (this.syncTimer) {
+      clearInterval(this.syncTimer);
+      this.syncTimer = null;
+    }
+  }
+
+  /**
+   * Re-sync from the configured source. Calls made while a sync is running
+   * schedule one more pass instead of reading in parallel. Resolves to
+   * whether the index is loaded.
+   */
+  refresh(): Promise<boolean> {
+    if (this.syncing) {
+      this.resyncRequested = true;
+      return this.syncing;
+    }
+
+    this.syncing = this.runSync().finally(() => {
+      this.syncing = null;
+    });
+    return this.syncing;
+  }
+
+  /**
+   * Find existing scholarships that are likely duplicates of the candidate,
+   * ordered by similarity
+   */
+  findDuplicates(candidate: DuplicateCandidate, threshold: number = DEFAULT_THRESHOLD): DuplicateMatch[] {
+    const matches: DuplicateMatch[] = [];
+
+    const urlKey = canonicalizeUrl(candidate.applicationUrl);
+    const urlMatchId = urlKey ? this.urlIndex.get(urlKey)?.[0] : undefined;
+    if (urlMatchId) {
+      matches.push({ existingId: urlMatchId, similarity: 1, matchType: 'url' });
+    }
+
+    const signature = computeSignature(tokenize(candidate));
+    const candidateIds = new Set<string>();
+    computeBandKeys(signature).forEach((key, band) => {
+      for (const id of this.buckets[band].get(key) || []) {
+        candidateIds.add(id);
+      }
+    });
+
+    for (const id of candidateIds) {
+      if (id === urlMatchId) continue;
+      const entry = this.entries.get(id);
+      if (!entry) continue;
+
+      const similarity = estimateSimilarity(signature, entry.signature);
+      if (similarity >= threshold) {
+        matches.push({ existingId: id, similarity, matchType: 'near_duplicate' });
+      }
+    }
+
+    return matches.sort((a, b) => b.similarity - a.similarity);
+  }
+
+  /**
+   * Clear the index
+   */
+  clear(): void {
+    this.entries.clear();
+    this.buckets.forEach(bucket => bucket.clear());
+    this.urlIndex.clear();
+  }
+
+  private async runSync(): Promise<boolean> {
+    if (!this.loadScholarships) return this.loaded;
+
+    do {
+      this.resyncRequested = false;
+      try {
+        this.sync(await this.loadScholarships());
+      } catch (error) {
+        console.warn('Failed to sync duplicate index, keeping the current index:', error);
+      }
+    } while (this.resyncRequested);
+
+    return this.loaded;
+  }
+
+  private fingerprint(candidate: DuplicateCandidate): string {
+    return [
+      normalizeText(candidate.title),
+      normalizeText(candidate.provider),
+      candidate.amount || '',
+      normalizeDeadline(candidate.deadline),
+      canonicalizeUrl(candidate.applicationUrl),
+    ].join('|');
+  }
+}
+
+// Export singleton instance
+export const duplicateIndexService = new DuplicateIndexService();
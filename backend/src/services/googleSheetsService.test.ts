@@ -0,0 +1,283 @@
+import { GoogleSheetsService } from './googleSheetsService';
+import { Scholarship } from '../types/scholarship';
+
+const makeScholarship = (id: string, overrides: Partial<Scholarship> = {}): Scholarship => ({
+  id,
+  title: `Scholarship ${id}`,
+  description: 'Awarded for academic merit.',
+  amount: '$1,000',
+  deadline: new Date('2030-01-15'),
+  eligibility: ['Undergraduate'],
+  requirements: ['Essay'],
+  applicationUrl: `https://example.org/${id}`,
+  provider: 'Example Foundation',
+  location: 'United States',
+  category: 'General',
+  isActive: true,
+  status: 'active',
+  ...overrides,
+});
+
+const toRow = (scholarship: Scholarship): string[] => [
+  scholarship.id,
+  scholarship.title,
+  scholarship.description,
+  scholarship.amount,
+  scholarship.deadline.toISOString().split('T')[0],
+  scholarship.eligibility.join(', '),
+  scholarship.requirements.join(', '),
+  scholarship.applicationUrl,
+  scholarship.provider,
+  scholarship.category,
+  scholarship.status || 'active',
+  '2025-01-01T00:00:00.000Z',
+  '2025-01-01T00:00:00.000Z',
+  'admin@example.com',
+  'admin@example.com',
+];
+
+/**
+ * Stub of the Sheets values API. Appends to the Scholarships sheet report
+ * an updated range starting at appendStartRow (after the existing rows by
+ * default).
+ */
+const createSheetsStub = (rows: string[][], appendStartRow: number = rows.length + 2) => {
+  let nextAppendRow = appendStartRow;
+  return {
+    spreadsheets: {
+      values: {
+        get: jest.fn().mockResolvedValue({ data: { values: rows } }),
+        batchUpdate: jest.fn().mockResolvedValue({ data: {} }),
+        append: jest.fn().mockImplementation(async (request: any) => {
+          if (request.range !== 'Scholarships!A:O') return { data: {} };
+          const count = request.requestBody.values.length;
+          const updatedRange = `Scholarships!A${nextAppendRow}:O${nextAppendRow + count - 1}`;
+          nextAppendRow += count;
+          return { data: { updates: { updatedRange } } };
+        }),
+      },
+    },
+  };
+};
+
+type SheetsStub = ReturnType<typeof createSheetsStub>;
+
+const createService = (sheets: SheetsStub): GoogleSheetsService => {
+  const service = new GoogleSheetsService();
+  Object.assign(service, { sheets, spreadsheetId: 'test-sheet', isInitialized: true });
+  return service;
+};
+
+const scholarshipAppends = (sheets: SheetsStub) =>
+  sheets.spreadsheets.values.append.mock.calls.filter(([request]) => request.range === 'Scholarships!A:O');
+
+const auditAppends = (sheets: SheetsStub) =>
+  sheets.spreadsheets.values.append.mock.calls.filter(([request]) => request.range === 'AuditLog!A:G');
+
+describe('GoogleSheetsService.upsertScholarships', () => {
+  beforeEach(() => {
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+    jest.spyOn(console, 'warn').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('writes only changed and new rows', async () => {
+    const existing = makeScholarship('scholarship-2');
+    const changed = makeScholarship('scholarship-3');
+    const sheets = createSheetsStub([toRow(existing), toRow(changed)]);
+    const service = createService(sheets);
+
+    const { id: _id, ...newScholarship } = makeScholarship('new');
+    const { written, ...result } = await service.upsertScholarships([
+      existing,
+      { ...changed, amount: '$2,000' },
+      newScholarship,
+      makeScholarship('custom-1'),
+    ], 'editor@example.com');
+
+    expect(result).toEqual({
+      inserted: ['scholarship-4', 'custom-1'],
+      updated: ['scholarship-3'],
+      unchanged: ['scholarship-2'],
+      failed: [],
+      apiCalls: 3,
+    });
+    expect(written.map(s => [s.id, s.amount])).toEqual([
+      ['scholarship-3', '$2,000'],
+      ['scholarship-4', '$1,000'],
+      ['custom-1', '$1,000'],
+    ]);
+
+    expect(sheets.spreadsheets.values.get).toHaveBeenCalledTimes(1);
+    expect(sheets.spreadsheets.values.batchUpdate).toHaveBeenCalledTimes(1);
+    const [updateRequest] = sheets.spreadsheets.values.batchUpdate.mock.calls[0];
+    expect(updateRequest.requestBody.data.map((range: any) => range.range)).toEqual(['Scholarships!A3:O3']);
+
+    const appends = scholarshipAppends(sheets);
+    expect(appends).toHaveLength(1);
+    expect(appends[0][0].requestBody.values.map((row: string[]) => row[0])).toEqual(['scholarship-4', 'custom-1']);
+
+    expect(auditAppends(sheets)).toHaveLength(1);
+    expect(auditAppends(sheets)[0][0].requestBody.values).toHaveLength(3);
+  });
+
+  it('corrects generated IDs to the rows the append landed on', async () => {
+    const sheets = createSheetsStub([toRow(makeScholarship('scholarship-2'))], 7);
+    const service = createService(sheets);
+
+    const { id: _id, ...newScholarship } = makeScholarship('new');
+    const result = await service.upsertScholarships([newScholarship, makeScholarship('custom-1')], 'editor@example.com');
+
+    expect(result.inserted).toEqual(['scholarship-7', 'custom-1']);
+    expect(result.written.map(s => s.id)).toEqual(['scholarship-7', 'custom-1']);
+    expect(result.apiCalls).toBe(3);
+    expect(sheets.spreadsheets.values.batchUpdate).toHaveBeenCalledTimes(1);
+    expect(sheets.spreadsheets.values.batchUpdate.mock.calls[0][0].requestBody.data).toEqual([
+      { range: 'Scholarships!A7', values: [['scholarship-7']] },
+    ]);
+  });
+
+  it('rejects row-number IDs that are not in the sheet', async () => {
+    const sheets = createSheetsStub([toRow(makeScholarship('scholarship-2'))]);
+    const service = createService(sheets);
+
+    const { id: _id, ...newScholarship } = makeScholarship('new');
+    const result = await service.upsertScholarships([
+      makeScholarship('scholarship-3'),
+      newScholarship,
+    ], 'editor@example.com');
+
+    expect(result.failed).toEqual([
+      { id: 'scholarship-3', title: 'Scholarship scholarship-3', error: 'Scholarship not found' },
+    ]);
+    expect(result.inserted).toEqual(['scholarship-3']);
+    expect(scholarshipAppends(sheets)[0][0].requestBody.values).toHaveLength(1);
+  });
+
+  it('splits inserts into chunks of 500 rows', async () => {
+    const sheets = createSheetsStub([]);
+    const service = createService(sheets);
+
+    const items = Array.from({ length: 1200 }, (_, i) => makeScholarship(`custom-${i}`));
+    const result = await service.upsertScholarships(items, 'editor@example.com');
+
+    expect(result.inserted).toHaveLength(1200);
+    expect(result.apiCalls).toBe(4);
+    expect(scholarshipAppends(sheets).map(([request]) => request.requestBody.values.length)).toEqual([500, 500, 200]);
+    expect(sheets.spreadsheets.values.batchUpdate).not.toHaveBeenCalled();
+  });
+
+  it('retries writes that hit the quota', async () => {
+    jest.spyOn(global, 'setTimeout').mockImplementation(((callback: () => void) => {
+      callback();
+      return 0;
+    }) as any);
+
+    const changed = makeScholarship('scholarship-2');
+    const sheets = createSheetsStub([toRow(changed)]);
+    sheets.spreadsheets.values.batchUpdate.mockRejectedValueOnce({ code: 429, message: 'Quota exceeded' });
+    const service = createService(sheets);
+
+    const result = await service.upsertScholarships([{ ...changed, title: 'Renamed' }], 'editor@example.com');
+
+    expect(result.updated).toEqual(['scholarship-2']);
+    expect(sheets.spreadsheets.values.batchUpdate).toHaveBeenCalledTimes(2);
+  });
+});
+
+describe('GoogleSheetsService.upsertScholarships write failures', () => {
+  beforeEach(() => {
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+    jest.spyOn(console, 'warn').mockImplementation(() => {});
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('reports a failed update chunk and still writes the inserts', async () => {
+    const changed = makeScholarship('scholarship-2');
+    const sheets = createSheetsStub([toRow(changed)]);
+    sheets.spreadsheets.values.batchUpdate.mockRejectedValueOnce(new Error('Backend error'));
+    const service = createService(sheets);
+
+    const result = await service.upsertScholarships([
+      { ...changed, title: 'Renamed' },
+      makeScholarship('custom-1'),
+    ], 'editor@example.com');
+
+    expect(result.updated).toEqual([]);
+    expect(result.inserted).toEqual(['custom-1']);
+    expect(result.failed).toEqual([{ id: 'scholarship-2', title: 'Renamed', error: 'Failed to write update' }]);
+
+    const auditRows = auditAppends(sheets)[0][0].requestBody.values;
+    expect(auditRows.map((row: string[]) => [row[1], row[2]])).toEqual([['created', 'custom-1']]);
+  });
+
+  it('audits the insert chunks written before a failed one', async () => {
+    const sheets = createSheetsStub([]);
+    sheets.spreadsheets.values.append
+      .mockImplementationOnce(async (request: any) => ({
+        data: { updates: { updatedRange: `Scholarships!A2:O${request.requestBody.values.length + 1}` } },
+      }))
+      .mockRejectedValueOnce(new Error('Backend error'));
+    const service = createService(sheets);
+
+    const items = Array.from({ length: 700 }, (_, i) => makeScholarship(`custom-${i}`));
+    const result = await service.upsertScholarships(items, 'editor@example.com');
+
+    expect(result.inserted).toHaveLength(500);
+    expect(result.failed).toHaveLength(200);
+    expect(result.failed[0]).toEqual({ id: 'custom-500', title: 'Scholarship custom-500', error: 'Failed to write scholarship' });
+    expect(auditAppends(sheets)[0][0].requestBody.values).toHaveLength(500);
+  });
+});
+
+describe('GoogleSheetsService.bulkUpdateScholarships', () => {
+  beforeEach(() => {
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('reads the sheet once and writes in chunks', async () => {
+    const scholarships = Array.from({ length: 600 }, (_, i) => makeScholarship(`scholarship-${i + 2}`));
+    const sheets = createSheetsStub(scholarships.map(toRow));
+    const service = createService(sheets);
+
+    const results = await service.bulkUpdateScholarships(
+      [...scholarships.map(s => s.id), 'missing'],
+      { category: 'STEM' },
+      'editor@example.com'
+    );
+
+    expect(sheets.spreadsheets.values.get).toHaveBeenCalledTimes(1);
+    expect(sheets.spreadsheets.values.batchUpdate).toHaveBeenCalledTimes(2);
+    expect(results.filter(r => r.success)).toHaveLength(600);
+    expect(results[600]).toEqual({ id: 'missing', success: false, error: 'Scholarship not found' });
+  });
+
+  it('reports per-ID results when a write chunk fails', async () => {
+    const scholarships = Array.from({ length: 600 }, (_, i) => makeScholarship(`scholarship-${i + 2}`));
+    const sheets = createSheetsStub(scholarships.map(toRow));
+    sheets.spreadsheets.values.batchUpdate.mockRejectedValueOnce(new Error('Backend error'));
+    const service = createService(sheets);
+
+    const results = await service.bulkUpdateScholarships(
+      scholarships.map(s => s.id),
+      { category: 'STEM' },
+      'editor@example.com'
+    );
+
+    expect(results.slice(0, 500).every(r => !r.success && r.error === 'Failed to write update' && !r.scholarship)).toBe(true);
+    expect(results.slice(500).every(r => r.success && r.scholarship?.category === 'STEM')).toBe(true);
+    expect(auditAppends(sheets)[0][0].requestBody.values).toHaveLength(100);
+  });
+});
@@ -1,3 +1,4 @@
+import { createHash } from 'crypto';
 import { google, sheets_v4 } from 'googleapis';
 import { 
   Scholarship, 
@@ -6,6 +7,28 @@ import {
   SheetRow 
 } from '../types/scholarship';
 
+// Maximum number of rows written per batch API call
+const BATCH_CHUNK_SIZE = 500;
+const MAX_QUOTA_RETRIES = 5;
+// IDs assigned from row numbers by createScholarship and batch inserts
+const GENERATED_ID_PATTERN = /^scholarship-\d+$/;
+
+export interface BatchUpsertResult {
+  inserted: string[];
+  updated: string[];
+  unchanged: string[];
+  failed: { id?: string; title: string; error: string }[];
+  apiCalls: number;
+  written: Scholarship[]; // Inserted and updated scholarships as written
+}
+
+export interface BulkUpdateResult {
+  id: string;
+  success: boolean;
+  error?: string;
+  scholarship?: Scholarship; // The updated scholarship as written
+}
+
 /**
  * Service for managing Google Sheets operations with proper error handling
  */
@@ -79,6 +102,21 @@ export class GoogleSheetsService {
    * Get all scholarships from the main sheet
    */
   async getScholarships(): Promise<Scholarship[]> {
+    try {
+      return await this.fetchScholarships();
+    } catch (error) {
+      console.error('Error fetching scholarships from Google Sheets:', error);
+      console.log('Falling back to demo data');
+      return this.generateDemoData();
+    }
+  }
+
+  /**
+   * Get all scholarships from the main sheet, throwing on read errors
+   * instead of falling back to demo data. Demo data is only returned when
+   * Google Sheets is not configured at all.
+   */
+  async fetchScholarships(): Promise<Scholarship[]> {
     await this.ensureInitialized();
     
     if (!this.isConfigured()) {
@@ -86,19 +124,13 @@ export class GoogleSheetsService {
       return this.generateDemoData();
     }
 
-    try {
-      const response = await this.sheets!.spreadsheets.values.get({
-        spreadsheetId: this.spreadsheetId!,
-        range: 'Scholarships!A2:O', // Skip header row
-      });
+    const response = await this.sheets!.spreadsheets.values.get({
+      spreadsheetId: this.spreadsheetId!,
+      range: 'Scholarships!A2:O', // Skip header row
+    });
 
-      const rows = response.data.values || [];
-      return rows.map((row: string[], index: number) => this.transformRowToScholarship(row, index + 2));
-    } catch (error) {
-      console.error('Error fetching scholarships from Google Sheets:', error);
-      console.log('Falling back to demo data');
-      return this.generateDemoData();
-    }
+    const rows = response.data.values || [];
+    return rows.map((row: string[], index: number) => this.transformRowToScholarship(row, index + 2));
   }
 
   /**
@@ -158,19 +190,20 @@ export class GoogleSheetsService {
   }
 
   /**
-   * Update an existing scholarship
+   * Update an existing scholarship. Returns the scholarship as written, or
+   * null when Google Sheets is not configured.
    */
   async updateScholarship(
     id: string, 
     updates: Partial<Scholarship>, 
     userEmail: string
-  ): Promise<void> {
+  ): Promise<Scholarship | null> {
     await this.ensureInitialized();
     
     if (!this.isConfigured()) {
       console.log('Google Sheets not configured, simulating update');
       console.log(`Would update scholarship ${id} with:`, Object.keys(updates));
-      return;
+      return null;
     }
 
     try {
@@ -223,6 +256,8 @@ export class GoogleSheetsService {
         changesMade: `Updated fields: ${Object.keys(updates).join(', ')}`,
         previousValues: currentScholarship,
       });
+
+      return updatedScholarship;
     } catch (error) {
       console.error('Error updating scholarship:', error);
       throw new Error('Failed to update scholarship');
@@ -247,19 +282,290 @@ export class GoogleSheetsService {
     });
   }
 
+  /**
+   * Insert or update many scholarships with a handful of API calls.
+   * The sheet is read once, rows are diffed by ID and content hash, and
+   * only inserted or changed rows are written, in chunked batch requests.
+   * Items carrying a row-number ID that is not in the sheet, and items in
+   * a write chunk that fails, are reported as failed; the chunks that were
+   * written are still audited.
+   */
+  async upsertScholarships(
+    scholarships: Array<Scholarship | Omit<Scholarship, 'id'>>,
+    userEmail: string
+  ): Promise<BatchUpsertResult> {
+    await this.ensureInitialized();
+
+    const result: BatchUpsertResult = { inserted: [], updated: [], unchanged: [], failed: [], apiCalls: 0, written: [] };
+
+    if (!this.isConfigured()) {
+      console.log(`Google Sheets not configured, simulating batch upsert of ${scholarships.length} scholarships`);
+      return result;
+    }
+
+    try {
+      const snapshot = await this.readScholarshipRows();
+      result.apiCalls++;
+
+      const updates: { scholarship: Scholarship; range: sheets_v4.Schema$ValueRange; action: AuditAction }[] = [];
+      const inserts: { row: string[]; scholarship: Omit<Scholarship, 'id'>; generatedId: boolean }[] = [];
+      const auditActions: AuditAction[] = [];
+      let nextRowNumber = snapshot.nextRowNumber;
+
+      for (const scholarship of scholarships) {
+        const id = 'id' in scholarship ? scholarship.id : '';
+        const current = id ? snapshot.rowsById.get(id) : undefined;
+
+        if (current) {
+          const currentScholarship = this.transformRowToScholarship(current.row, current.rowNumber);
+          const updatedScholarship: Scholarship = {
+            ...scholarship,
+            id,
+            createdDate: currentScholarship.createdDate,
+            createdBy: currentScholarship.createdBy || userEmail,
+          };
+          const updatedRow = this.transformScholarshipToRow(updatedScholarship, userEmail, true);
+
+          if (this.hashRowContent(updatedRow) === this.hashRowContent(current.row)) {
+            result.unchanged.push(id);
+            continue;
+          }
+
+          updates.push({
+            scholarship: updatedScholarship,
+            range: {
+              range: `Scholarships!A${current.rowNumber}:O${current.rowNumber}`,
+              values: [updatedRow],
+            },
+            action: {
+              timestamp: new Date(),
+              action: 'updated',
+              scholarshipId: id,
+              userEmail,
+              changesMade: `Batch updated scholarship: ${scholarship.title}`,
+              previousValues: currentScholarship,
+            },
+          });
+        } else if (id && GENERATED_ID_PATTERN.test(id)) {
+          // A row-number ID that is not in the sheet would collide with the
+          // IDs generated for new rows
+          result.failed.push({ id, title: scholarship.title, error: 'Scholarship not found' });
+        } else {
+          // IDs follow the same row-number scheme as createScholarship; the
+          // predicted row is checked against the append response below
+          const newId = id || `scholarship-${nextRowNumber}`;
+          nextRowNumber++;
+
+          inserts.push({
+            row: this.transformScholarshipToRow({ ...scholarship, id: newId }, userEmail),
+            scholarship,
+            generatedId: !id,
+          });
+        }
+      }
+
+      for (let i = 0; i < updates.length; i += BATCH_CHUNK_SIZE) {
+        const chunk = updates.slice(i, i + BATCH_CHUNK_SIZE);
+        result.apiCalls++;
+        try {
+          await this.batchUpdateRows(chunk.map(update => update.range));
+          for (const update of chunk) {
+            result.updated.push(update.scholarship.id);
+            result.written.push(update.scholarship);
+            auditActions.push(update.action);
+          }
+        } catch (error) {
+          console.error('Error writing batch upsert update chunk:', error);
+          for (const update of chunk) {
+            result.failed.push({ id: update.scholarship.id, title: update.scholarship.title, error: 'Failed to write update' });
+          }
+        }
+      }
+
+      const written: typeof inserts = [];
+      const idFixes: { insert: typeof inserts[number]; predictedId: string; range: sheets_v4.Schema$ValueRange }[] = [];
+      for (let i = 0; i < inserts.length; i += BATCH_CHUNK_SIZE) {
+        const chunk = inserts.slice(i, i + BATCH_CHUNK_SIZE);
+        let appendedRow: number | null = null;
+        result.apiCalls++;
+        try {
+          appendedRow = await this.appendRows(chunk.map(insert => insert.row));
+        } catch (error) {
+          console.error('Error writing batch upsert insert chunk:', error);
+          for (const insert of chunk) {
+            result.failed.push({
+              ...(insert.generatedId ? {} : { id: insert.row[0] }),
+              title: insert.scholarship.title,
+              error: 'Failed to write scholarship',
+            });
+          }
+          continue;
+        }
+        written.push(...chunk);
+
+        if (appendedRow === null) {
+          console.warn('Could not read the appended row range, keeping predicted scholarship IDs');
+          continue;
+        }
+        const startRow = appendedRow;
+
+        // Rows can land elsewhere than predicted (e.g. blank rows in the
+        // sheet), so generated IDs are corrected to the actual row numbers
+        chunk.forEach((insert, offset) => {
+          const actualId = `scholarship-${startRow + offset}`;
+          if (insert.generatedId && insert.row[0] !== actualId) {
+            idFixes.push({
+              insert,
+              predictedId: insert.row[0],
+              range: { range: `Scholarships!A${startRow + offset}`, values: [[actualId]] },
+            });
+            insert.row[0] = actualId;
+          }
+        });
+      }
+
+      for (let i = 0; i < idFixes.length; i += BATCH_CHUNK_SIZE) {
+        const chunk = idFixes.slice(i, i + BATCH_CHUNK_SIZE);
+        result.apiCalls++;
+        try {
+          await this.batchUpdateRows(chunk.map(fix => fix.range));
+        } catch (error) {
+          // The rows are written; they keep the predicted IDs in the sheet
+          console.error('Error correcting generated scholarship IDs:', error);
+          for (const fix of chunk) {
+            fix.insert.row[0] = fix.predictedId;
+          }
+        }
+      }
+
+      for (const insert of written) {
+        result.inserted.push(insert.row[0]);
+        result.written.push({ ...insert.scholarship, id: insert.row[0] });
+        auditActions.push({
+          timestamp: new Date(),
+          action: 'created',
+          scholarshipId: insert.row[0],
+          userEmail,
+          changesMade: `Created scholarship: ${insert.scholarship.title}`,
+        });
+      }
+
+      console.log(`📦 Batch upsert: ${result.inserted.length} inserted, ${result.updated.length} updated, ${result.unchanged.length} unchanged, ${result.failed.length} failed in ${result.apiCalls} API calls`);
+
+      await this.logActions(auditActions);
+      return result;
+    } catch (error) {
+      console.error('Error in batch upsert:', error);
+      throw new Error('Failed to batch upsert scholarships');
+    }
+  }
+
+  /**
+   * Apply the same updates to several scholarships, reading the sheet once
+   * instead of looking up each row separately. A failed write chunk marks
+   * only its own IDs as failed.
+   */
+  async bulkUpdateScholarships(
+    ids: string[],
+    updates: Partial<Scholarship>,
+    userEmail: string
+  ): Promise<BulkUpdateResult[]> {
+    await this.ensureInitialized();
+
+    if (!this.isConfigured()) {
+      console.log('Google Sheets not configured, simulating bulk update');
+      console.log(`Would update ${ids.length} scholarships with:`, Object.keys(updates));
+      return ids.map(id => ({ id, success: true }));
+    }
+
+    try {
+      const snapshot = await this.readScholarshipRows();
+      const results: BulkUpdateResult[] = [];
+      const pending: { result: BulkUpdateResult; range: sheets_v4.Schema$ValueRange; action: AuditAction }[] = [];
+      const auditActions: AuditAction[] = [];
+
+      for (const id of ids) {
+        const current = snapshot.rowsById.get(id);
+        if (!current) {
+          results.push({ id, success: false, error: 'Scholarship not found' });
+          continue;
+        }
+
+        const currentScholarship = this.transformRowToScholarship(current.row, current.rowNumber);
+        const updatedScholarship: Scholarship = {
+          ...currentScholarship,
+          ...updates,
+          id,
+          modifiedDate: new Date(),
+          lastModifiedBy: userEmail,
+        };
+
+        const result: BulkUpdateResult = { id, success: true, scholarship: updatedScholarship };
+        results.push(result);
+        pending.push({
+          result,
+          range: {
+            range: `Scholarships!A${current.rowNumber}:O${current.rowNumber}`,
+            values: [this.transformScholarshipToRow(updatedScholarship, userEmail, true)],
+          },
+          action: {
+            timestamp: new Date(),
+            action: 'updated',
+            scholarshipId: id,
+            userEmail,
+            changesMade: `Updated fields: ${Object.keys(updates).join(', ')}`,
+            previousValues: currentScholarship,
+          },
+        });
+      }
+
+      for (let i = 0; i < pending.length; i += BATCH_CHUNK_SIZE) {
+        const chunk = pending.slice(i, i + BATCH_CHUNK_SIZE);
+        try {
+          await this.batchUpdateRows(chunk.map(item => item.range));
+          auditActions.push(...chunk.map(item => item.action));
+        } catch (error) {
+          console.error('Error writing bulk update chunk:', error);
+          for (const item of chunk) {
+            item.result.success = false;
+            item.result.error = 'Failed to write update';
+            delete item.result.scholarship;
+          }
+        }
+      }
+
+      await this.logActions(auditActions);
+      return results;
+    } catch (error) {
+      console.error('Error in bulk update:', error);
+      throw new Error('Failed to bulk update scholarships');
+    }
+  }
+
   /**
    * Log an action to the audit sheet
    */
   async logAction(action: AuditAction): Promise<void> {
+    await this.logActions([action]);
+  }
+
+  /**
+   * Log several actions to the audit sheet in a single append
+   */
+  async logActions(actions: AuditAction[]): Promise<void> {
     await this.ensureInitialized();
     
     if (!this.isConfigured()) {
-      console.log('Audit log:', action.action, action.scholarshipId, action.userEmail);
+      for (const action of actions) {
+        console.log('Audit log:', action.action, action.scholarshipId, action.userEmail);
+      }
       return;
     }
 
+    if (actions.length === 0) return;
+
     try {
-      const auditRow = [
+      const auditRows = actions.map(action => [
         action.timestamp.toISOString(),
         action.action,
         action.scholarshipId || '',
@@ -267,16 +573,16 @@ export class GoogleSheetsService {
         action.changesMade || '',
         action.previousValues ? JSON.stringify(action.previousValues) : '',
         action.ipAddress || '',
-      ];
+      ]);
 
-      await this.sheets!.spreadsheets.values.append({
+      await this.withQuotaRetry(() => this.sheets!.spreadsheets.values.append({
         spreadsheetId: this.spreadsheetId!,
         range: 'AuditLog!A:G',
         valueInputOption: 'RAW',
         requestBody: {
-          values: [auditRow],
+          values: auditRows,
         },
-      });
+      }));
     } catch (error) {
       console.error('Error logging action:', error);
       // Don't throw error for audit logging failures
@@ -369,6 +675,93 @@ export class GoogleSheetsService {
     }
   }
 
+  /**
+   * Read the Scholarships sheet once and index its rows by ID
+   */
+  private async readScholarshipRows(): Promise<{
+    rowsById: Map<string, { rowNumber: number; row: string[] }>;
+    nextRowNumber: number;
+  }> {
+    const response = await this.withQuotaRetry(() => this.sheets!.spreadsheets.values.get({
+      spreadsheetId: this.spreadsheetId!,
+      range: 'Scholarships!A2:O', // Skip header row
+    }));
+
+    const rows: string[][] = response.data.values || [];
+    const rowsById = new Map<string, { rowNumber: number; row: string[] }>();
+    rows.forEach((row, index) => {
+      if (row[0]) {
+        rowsById.set(row[0], { rowNumber: index + 2, row });
+      }
+    });
+
+    return { rowsById, nextRowNumber: rows.length + 2 };
+  }
+
+  /**
+   * Write a set of ranges in a single batchUpdate call
+   */
+  private async batchUpdateRows(ranges: sheets_v4.Schema$ValueRange[]): Promise<void> {
+    await this.withQuotaRetry(() => this.sheets!.spreadsheets.values.batchUpdate({
+      spreadsheetId: this.spreadsheetId!,
+      requestBody: {
+        valueInputOption: 'RAW',
+        data: ranges,
+      },
+    }));
+  }
+
+  /**
+   * Append rows to the Scholarships sheet in a single call. Returns the
+   * first row number written, or null if the response has no range.
+   */
+  private async appendRows(rows: string[][]): Promise<number | null> {
+    const response = await this.withQuotaRetry(() => this.sheets!.spreadsheets.values.append({
+      spreadsheetId: this.spreadsheetId!,
+      range: 'Scholarships!A:O',
+      valueInputOption: 'RAW',
+      insertDataOption: 'INSERT_ROWS',
+      requestBody: {
+        values: rows,
+      },
+    }));
+
+    const match = /![A-Z]+(\d+)/.exec(response.data.updates?.updatedRange || '');
+    return match ? parseInt(match[1]) : null;
+  }
+
+  /**
+   * Hash the content columns of a row (ID through Status), ignoring
+   * timestamps and user columns that change on every write
+   */
+  private hashRowContent(row: string[]): string {
+    const content = Array.from({ length: 11 }, (_, i) => row[i] || '');
+    return createHash('sha1').update(content.join('\u001f')).digest('hex');
+  }
+
+  /**
+   * Retry a Sheets API call with exponential backoff on quota errors
+   */
+  private async withQuotaRetry<T>(operation: () => Promise<T>): Promise<T> {
+    for (let attempt = 0; ; attempt++) {
+      try {
+        return await operation();
+      } catch (error: any) {
+        const status = error?.code ?? error?.response?.status;
+        const isQuotaError = status === 429 ||
+          (status === 403 && /quota|rate limit/i.test(error?.message || ''));
+
+        if (!isQuotaError || attempt >= MAX_QUOTA_RETRIES) {
+          throw error;
+        }
+
+        const delay = Math.min(1000 * 2 ** attempt, 32000) + Math.random() * 1000;
+        console.warn(`Google Sheets quota exceeded, retrying in ${Math.round(delay)}ms (attempt ${attempt + 1}/${MAX_QUOTA_RETRIES})`);
+        await new Promise(resolve => setTimeout(resolve, delay));
+      }
+    }
+  }
+
   /**
    * Find the row number for a scholarship by ID
    */
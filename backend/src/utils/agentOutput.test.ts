@@ -0,0 +1,104 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { isStreamedOutput, readRunOutput, readStreamedOutput } from './agentOutput';
+
+const item = (title: string, source: string) => ({
+  title,
+  description: 'Awarded for academic merit.',
+  amount: '$1,000',
+  deadline: '2030-01-15',
+  provider: 'Example Foundation',
+  applicationUrl: `https://example.org/${title}`,
+  source,
+});
+
+const ndjson = (records: any[]): string => records.map(record => JSON.stringify(record)).join('\n') + '\n';
+
+describe('agent output readers', () => {
+  let dir: string;
+  const writeOutput = (name: string, content: string): string => {
+    const file = path.join(dir, name);
+    fs.writeFileSync(file, content, 'utf-8');
+    return file;
+  };
+
+  beforeEach(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'agent-output-'));
+    jest.spyOn(console, 'warn').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+    jest.restoreAllMocks();
+  });
+
+  describe('isStreamedOutput', () => {
+    it('detects NDJSON from the first non-empty line', async () => {
+      const file = writeOutput('run.ndjson', `\n${ndjson([{ type: 'item', scholarship: item('a', 'fastweb') }])}`);
+      await expect(isStreamedOutput(file)).resolves.toBe(true);
+    });
+
+    it('treats a pretty-printed document as a single JSON document', async () => {
+      const file = writeOutput('run.json', JSON.stringify({ success: true, scholarships: [] }, null, 2));
+      await expect(isStreamedOutput(file)).resolves.toBe(false);
+    });
+
+    it('treats a one-line document without a type as a single JSON document', async () => {
+      const file = writeOutput('run.json', JSON.stringify({ success: true, scholarships: [] }));
+      await expect(isStreamedOutput(file)).resolves.toBe(false);
+    });
+
+    it('returns false for an empty file', async () => {
+      await expect(isStreamedOutput(writeOutput('run.ndjson', ''))).resolves.toBe(false);
+    });
+  });
+
+  describe('readStreamedOutput', () => {
+    it('counts only item records and keeps the summary', async () => {
+      const file = writeOutput('run.ndjson', ndjson([
+        { type: 'item', scholarship: item('a', 'fastweb') },
+        { type: 'item', ...item('b', 'fastweb') },
+        { type: 'progress', source: 'fastweb', pages: 3 },
+        { type: 'item', scholarship: item('c', 'niche') },
+        { type: 'summary', success: true, scholarships_discovered: 3 },
+      ]));
+
+      const output = await readStreamedOutput(file);
+
+      expect(output.item_count).toBe(3);
+      expect(output.items_by_source).toEqual({ fastweb: 2, niche: 1 });
+      expect(output.summary).toEqual({ type: 'summary', success: true, scholarships_discovered: 3 });
+      expect(output.quality_report).toEqual({ high_quality: 3, medium_quality: 0, low_quality: 0 });
+      expect(output.sample_scholarships.map(sample => sample.title)).toEqual(['a', 'b', 'c']);
+      expect(output.sample_scholarships[0]).toMatchObject({ amount_min: 1000, amount_max: 1000, deadline_date: '2030-01-15' });
+    });
+
+    it('skips a truncated last line', async () => {
+      const file = writeOutput('run.ndjson',
+        ndjson([{ type: 'item', scholarship: item('a', 'fastweb') }]) + '{"type":"item","scholarship":{"title":"b"');
+
+      const output = await readStreamedOutput(file);
+
+      expect(output.item_count).toBe(1);
+      expect(output.summary).toEqual({});
+      expect(console.warn).toHaveBeenCalledTimes(1);
+    });
+  });
+
+  describe('readRunOutput', () => {
+    it('reads a single JSON document whole', async () => {
+      const file = writeOutput('run.json', JSON.stringify({
+        success: true,
+        scholarships_discovered: 2,
+        scholarships: [item('a', 'fastweb'), item('b', 'niche')],
+      }, null, 2));
+
+      const output = await readRunOutput(file);
+
+      expect(output.summary.scholarships_discovered).toBe(2);
+      expect(output.item_count).toBe(2);
+      expect(output.items_by_source).toEqual({ fastweb: 1, niche: 1 });
+    });
+  });
+});
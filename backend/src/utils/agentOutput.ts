@@ -0,0 +1,187 @@
+/**
+ * Readers for the discovery agent's run output file.
+ *
+ * Agents that support `--output-format ndjson` write one JSON record per
+ * line: `item` records, then a single `summary` record. Older agents write
+ * one JSON document with the summary fields and a `scholarships` array.
+ */
+
+import fs from 'fs';
+import readline from 'readline';
+import { NormalizationReport, QualityReport, normalizeBatch } from './normalization';
+
+export interface RunOutput {
+  summary: any;
+  item_count: number;
+  quality_report?: QualityReport;
+  normalization_report?: NormalizationReport;
+  items_by_source: Record<string, number>;
+  sample_scholarships: any[];
+}
+
+const SAMPLE_SIZE = 5;
+const QUALITY_BATCH_SIZE = 1000;
+
+/**
+ * Aggregate scraped items into a run output, normalizing and scoring
+ * them in batches. Sample scholarships get their parsed amount range,
+ * deadline and lists attached.
+ */
+const createOutputCollector = () => {
+  const output: RunOutput = {
+    summary: {},
+    item_count: 0,
+    items_by_source: {},
+    sample_scholarships: []
+  };
+  const qualityReport: QualityReport = { high_quality: 0, medium_quality: 0, low_quality: 0 };
+  const normalizationReport: NormalizationReport = { with_amount: 0, with_deadline: 0, expired: 0 };
+  const sampleIndexes = new Map<any, number>();
+  const now = Date.now();
+
+  let batch: any[] = [];
+  const flushBatch = () => {
+    const normalized = normalizeBatch(batch);
+    qualityReport.high_quality += normalized.qualityReport.high_quality;
+    qualityReport.medium_quality += normalized.qualityReport.medium_quality;
+    qualityReport.low_quality += normalized.qualityReport.low_quality;
+
+    for (let i = 0; i < batch.length; i++) {
+      const deadline = normalized.deadlines[i];
+      if (!isNaN(normalized.amountMax[i])) normalizationReport.with_amount++;
+      if (!isNaN(deadline)) {
+        normalizationReport.with_deadline++;
+        if (deadline < now) normalizationReport.expired++;
+      }
+
+      const sampleIndex = sampleIndexes.get(batch[i]);
+      if (sampleIndex !== undefined) {
+        output.sample_scholarships[sampleIndex] = {
+          ...batch[i],
+          amount_min: isNaN(normalized.amountMin[i]) ? null : normalized.amountMin[i],
+          amount_max: isNaN(normalized.amountMax[i]) ? null : normalized.amountMax[i],
+          deadline_date: isNaN(deadline) ? null : new Date(deadline).toISOString().split('T')[0],
+          eligibility: normalized.eligibility[i],
+          requirements: normalized.requirements[i]
+        };
+      }
+    }
+
+    sampleIndexes.clear();
+    batch = [];
+  };
+
+  return {
+    output,
+    add: (scholarship: any) => {
+      output.item_count++;
+      batch.push(scholarship);
+      if (batch.length >= QUALITY_BATCH_SIZE) {
+        flushBatch();
+      }
+
+      const source = scholarship?.source || 'unknown';
+      output.items_by_source[source] = (output.items_by_source[source] || 0) + 1;
+
+      if (output.sample_scholarships.length < SAMPLE_SIZE && scholarship && typeof scholarship === 'object') {
+        sampleIndexes.set(scholarship, output.sample_scholarships.length);
+        output.sample_scholarships.push(scholarship);
+      }
+    },
+    finish: (): RunOutput => {
+      flushBatch();
+      output.quality_report = qualityReport;
+      output.normalization_report = normalizationReport;
+      return output;
+    }
+  };
+};
+
+/**
+ * Detect NDJSON output from the first non-empty line
+ */
+export const isStreamedOutput = async (outputFile: string): Promise<boolean> => {
+  const input = fs.createReadStream(outputFile, { encoding: 'utf-8' });
+  const lines = readline.createInterface({ input, crlfDelay: Infinity });
+
+  try {
+    for await (const line of lines) {
+      if (!line.trim()) continue;
+      try {
+        const record = JSON.parse(line);
+        return typeof record?.type === 'string';
+      } catch {
+        // First line of a pretty-printed document
+        return false;
+      }
+    }
+    return false;
+  } finally {
+    lines.close();
+    input.destroy();
+  }
+};
+
+/**
+ * Read NDJSON output line by line, aggregating the quality report (scored
+ * in batches) and per-source counts without holding every item in memory.
+ * Only `item` records are counted, unwrapped from their optional
+ * `scholarship` field; the `summary` record becomes the summary and other
+ * record types are ignored. Malformed lines, such as a truncated last
+ * line, are skipped.
+ */
+export const readStreamedOutput = async (outputFile: string): Promise<RunOutput> => {
+  const collector = createOutputCollector();
+  const lines = readline.createInterface({
+    input: fs.createReadStream(outputFile, { encoding: 'utf-8' }),
+    crlfDelay: Infinity
+  });
+
+  for await (const line of lines) {
+    if (!line.trim()) continue;
+
+    let record: any;
+    try {
+      record = JSON.parse(line);
+    } catch (error) {
+      console.warn('Skipping malformed discovery output line:', error);
+      continue;
+    }
+
+    if (record?.type === 'summary') {
+      collector.output.summary = record;
+    } else if (record?.type === 'item') {
+      collector.add(record.scholarship ?? record);
+    }
+  }
+
+  return collector.finish();
+};
+
+/**
+ * Read a single JSON document written by agents without NDJSON output
+ */
+export const readDocumentOutput = (outputFile: string): RunOutput => {
+  const resultData = JSON.parse(fs.readFileSync(outputFile, 'utf-8'));
+  const collector = createOutputCollector();
+  collector.output.summary = resultData;
+
+  if (!Array.isArray(resultData.scholarships)) {
+    return collector.output;
+  }
+
+  for (const scholarship of resultData.scholarships) {
+    collector.add(scholarship);
+  }
+  return collector.finish();
+};
+
+/**
+ * Read the agent's run output, streaming NDJSON and parsing a single JSON
+ * document whole
+ */
+export const readRunOutput = async (outputFile: string): Promise<RunOutput> => {
+  return (await isStreamedOutput(outputFile))
+    ? readStreamedOutput(outputFile)
+    : readDocumentOutput(outputFile);
+};
@@ -0,0 +1,118 @@
+/**
+ * Discovery pipeline metrics and Prometheus text formatting
+ */
+
+export interface StageMetrics {
+  count: number;
+  total_seconds: number;
+  p50_seconds?: number;
+  p95_seconds?: number;
+  max_seconds?: number;
+}
+
+export interface DomainMetrics {
+  requests: number;
+  errors: number;
+  avg_latency_seconds?: number;
+}
+
+/**
+ * Structured metrics block reported by the agent, plus timings measured
+ * by the backend around the agent process
+ */
+export interface AgentMetrics {
+  stages?: Record<string, Record<string, StageMetrics>>; // stage -> source -> stats
+  domains?: Record<string, DomainMetrics>;
+  memory_peak_mb?: number;
+  queue_depth_max?: Record<string, number>;
+  profile_file?: string;
+  backend?: {
+    process_seconds: number;
+    output_read_seconds: number;
+  };
+}
+
+const PREFIX = 'scholarship_agent';
+
+const escapeLabel = (value: string): string =>
+  value.replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n');
+
+type Sample = [Record<string, string>, number];
+
+const labels = (values: Record<string, string>): string => {
+  const parts = Object.entries(values).map(([key, value]) => `${key}="${escapeLabel(value)}"`);
+  return parts.length > 0 ? `{${parts.join(',')}}` : '';
+};
+
+/**
+ * Render run metrics in the Prometheus text exposition format
+ */
+export const formatPrometheusMetrics = (metrics: AgentMetrics, durationSeconds?: number): string => {
+  const lines: string[] = [];
+  const metric = (name: string, type: string, help: string, samples: Sample[]) => {
+    if (samples.length === 0) return;
+    lines.push(`# HELP ${PREFIX}_${name} ${help}`);
+    lines.push(`# TYPE ${PREFIX}_${name} ${type}`);
+    for (const [sampleLabels, value] of samples) {
+      lines.push(`${PREFIX}_${name}${labels(sampleLabels)} ${value}`);
+    }
+  };
+
+  const stageSamples = (pick: (stats: StageMetrics) => number | undefined): Sample[] => {
+    const samples: Sample[] = [];
+    for (const [stage, sources] of Object.entries(metrics.stages || {})) {
+      for (const [source, stats] of Object.entries(sources)) {
+        const value = pick(stats);
+        if (value !== undefined) samples.push([{ stage, source }, value]);
+      }
+    }
+    return samples;
+  };
+
+  const domainSamples = (pick: (stats: DomainMetrics) => number | undefined): Sample[] =>
+    Object.entries(metrics.domains || {})
+      .filter(([, stats]) => pick(stats) !== undefined)
+      .map(([domain, stats]): Sample => [{ domain }, pick(stats) as number]);
+
+  if (durationSeconds !== undefined) {
+    metric('run_duration_seconds', 'gauge', 'Duration of the last discovery run.', [[{}, durationSeconds]]);
+  }
+
+  metric('stage_calls', 'gauge', 'Calls per pipeline stage and source in the last run.', stageSamples(s => s.count));
+  metric('stage_seconds', 'gauge', 'Total time per pipeline stage and source in the last run.', stageSamples(s => s.total_seconds));
+  metric('stage_p50_seconds', 'gauge', 'Median time per pipeline stage call.', stageSamples(s => s.p50_seconds));
+  metric('stage_p95_seconds', 'gauge', '95th percentile time per pipeline stage call.', stageSamples(s => s.p95_seconds));
+  metric('stage_max_seconds', 'gauge', 'Slowest pipeline stage call.', stageSamples(s => s.max_seconds));
+
+  metric('domain_requests', 'gauge', 'Requests per domain in the last run.', domainSamples(d => d.requests));
+  metric('domain_errors', 'gauge', 'Failed requests per domain in the last run.', domainSamples(d => d.errors));
+  metric('domain_latency_seconds', 'gauge', 'Average request latency per domain.', domainSamples(d => d.avg_latency_seconds));
+
+  if (metrics.memory_peak_mb !== undefined) {
+    metric('memory_peak_bytes', 'gauge', 'Peak agent memory usage.', [[{}, metrics.memory_peak_mb * 1024 * 1024]]);
+  }
+
+  metric('queue_depth_max', 'gauge', 'Highest observed depth per pipeline queue.',
+    Object.entries(metrics.queue_depth_max || {}).map(([queue, depth]): Sample => [{ queue }, depth]));
+
+  if (metrics.backend) {
+    metric('backend_process_seconds', 'gauge', 'Wall time of the agent process as seen by the backend.', [[{}, metrics.backend.process_seconds]]);
+    metric('backend_output_read_seconds', 'gauge', 'Time the backend spent reading the run output.', [[{}, metrics.backend.output_read_seconds]]);
+  }
+
+  return lines.length > 0 ? `${lines.join('\n')}\n` : '';
+};
+
+/**
+ * Find the stage with the most total time across sources
+ */
+export const getSlowestStage = (metrics: AgentMetrics): { stage: string; total_seconds: number } | null => {
+  let slowest: { stage: string; total_seconds: number } | null = null;
+  for (const [stage, sources] of Object.entries(metrics.stages || {})) {
+    const total = Object.values(sources).reduce((sum, stats) => sum + (stats.total_seconds || 0), 0);
+    if (!slowest || total > slowest.total_seconds) {
+      slowest = { stage, total_seconds: total };
+    }
+  }
+  return slowest;
+};
@@ -0,0 +1,83 @@
+import { normalizeBatch, parseAmountRange, parseDeadline } from './normalization';
+
+describe('parseAmountRange', () => {
+  it.each([
+    ['$5,000', { min: 5000, max: 5000 }],
+    ['up to $10k', { min: null, max: 10000 }],
+    ['$1,000 - $2,500', { min: 1000, max: 2500 }],
+    ['$1,000-2,500', { min: 1000, max: 2500 }],
+    ['$1.5 million', { min: 1500000, max: 1500000 }],
+    ['varies', { min: null, max: null }],
+    ['', { min: null, max: null }],
+  ])('parses %j', (raw, expected) => {
+    expect(parseAmountRange(raw)).toEqual(expected);
+  });
+
+  it('does not read a unit out of the following word', () => {
+    expect(parseAmountRange('$500 monthly')).toEqual({ min: 500, max: 500 });
+  });
+
+  it.each([
+    ['$5,000 (renewable for 4 years)', { min: 5000, max: 5000 }],
+    ['$2,000 for 2026 graduates', { min: 2000, max: 2000 }],
+    ['up to $10,000 for 2 students', { min: null, max: 10000 }],
+  ])('ignores numbers without a $ or unit in %j', (raw, expected) => {
+    expect(parseAmountRange(raw)).toEqual(expected);
+  });
+});
+
+describe('parseDeadline', () => {
+  it.each([
+    ['2026-03-15', Date.UTC(2026, 2, 15)],
+    ['03/15/2026', Date.UTC(2026, 2, 15)],
+    ['03/15/26', Date.UTC(2026, 2, 15)],
+    ['March 31, 2026', Date.UTC(2026, 2, 31)],
+    ['Apr 1st, 2026', Date.UTC(2026, 3, 1)],
+    ['02/29/2028', Date.UTC(2028, 1, 29)],
+  ])('parses %j', (raw, expected) => {
+    expect(parseDeadline(raw)).toBe(expected);
+  });
+
+  it.each([
+    '02/31/2026',
+    '2026-02-31',
+    'February 31, 2026',
+    '02/29/2026',
+    '2026-04-31T00:00:00Z',
+    'Rolling',
+    'Not available',
+    'Fall 2026',
+    'Open until filled 2026',
+    'Due 3/1',
+    '12',
+  ])(
+    'rejects %j',
+    (raw) => {
+      expect(parseDeadline(raw)).toBeNaN();
+    }
+  );
+});
+
+describe('normalizeBatch', () => {
+  it('returns columnar values and quality tiers', () => {
+    const batch = normalizeBatch([
+      {
+        title: 'STEM Scholarship',
+        description: 'For engineering students.',
+        amount: '$1,000 - $2,500',
+        deadline: '2026-03-15',
+        provider: 'Example Foundation',
+        applicationUrl: 'https://example.org/stem',
+        eligibility: ' Undergraduate ,, GPA 3.0+ ',
+      },
+      { title: 'Untitled', amount: 'varies', deadline: 'Rolling' },
+    ]);
+
+    expect(Array.from(batch.amountMin)).toEqual([1000, NaN]);
+    expect(Array.from(batch.amountMax)).toEqual([2500, NaN]);
+    expect(Array.from(batch.deadlines)).toEqual([Date.UTC(2026, 2, 15), NaN]);
+    expect(batch.eligibility).toEqual([['Undergraduate', 'GPA 3.0+'], []]);
+    expect(batch.tiers).toEqual(['high', 'medium']);
+    expect(batch.qualityReport).toEqual({ high_quality: 1, medium_quality: 1, low_quality: 0 });
+  });
+});
@@ -0,0 +1,236 @@
+/**
+ * Batch normalization and quality scoring for scraped scholarships.
+ *
+ * Items are processed column by column into typed arrays, and repeated
+ * amount, deadline and list strings are parsed once per batch.
+ */
+
+export type QualityTier = 'high' | 'medium' | 'low';
+
+export interface QualityReport {
+  high_quality: number;
+  medium_quality: number;
+  low_quality: number;
+}
+
+/**
+ * Counts of normalized values across the items of a run
+ */
+export interface NormalizationReport {
+  with_amount: number;
+  with_deadline: number;
+  expired: number;
+}
+
+export interface AmountRange {
+  min: number | null;
+  max: number | null;
+}
+
+/**
+ * Columnar result of normalizing a batch. Missing numeric values are NaN.
+ */
+export interface NormalizedBatch {
+  amountMin: Float64Array;
+  amountMax: Float64Array;
+  deadlines: Float64Array; // Epoch milliseconds (UTC)
+  eligibility: string[][];
+  requirements: string[][];
+  tiers: QualityTier[];
+  qualityReport: QualityReport;
+}
+
+export const QUALITY_FIELDS = ['title', 'description', 'amount', 'deadline', 'provider', 'applicationUrl'];
+
+const MONTHS: Record<string, number> = {
+  jan: 0, feb: 1, mar: 2, apr: 3, may: 4, jun: 5,
+  jul: 6, aug: 7, sep: 8, oct: 9, nov: 10, dec: 11,
+};
+
+const DAYS_IN_MONTH = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31];
+
+const ISO_DATE = /^(\d{4})-(\d{2})-(\d{2})/;
+const US_DATE = /^(\d{1,2})\/(\d{1,2})\/(\d{2}|\d{4})$/;
+const LONG_DATE = /^([a-z]{3})[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})$/i;
+const AMOUNT_VALUE = /(\$)?\s*(\d[\d,]*(?:\.\d+)?)(?:\s*(k|m|thousand|million)\b)?/gi;
+const RANGE_SEPARATOR = /^\s*(?:-|–|—|to)\s*$/i;
+
+/**
+ * Parse a free-form amount such as "$5,000", "up to $10k" or
+ * "$1,000 - $2,500" into a numeric range. Only numbers with a "$" or a
+ * unit count as amounts, plus the upper end of a range, so years and
+ * counts ("for 4 years", "2 students") are ignored. Non-numeric values
+ * like "varies" or "full tuition" parse to nulls.
+ */
+export const parseAmountRange = (raw: string): AmountRange => {
+  if (!raw) return { min: null, max: null };
+
+  const values: number[] = [];
+  let lastAmountEnd = -1;
+  AMOUNT_VALUE.lastIndex = 0;
+  let match: RegExpExecArray | null;
+  while ((match = AMOUNT_VALUE.exec(raw)) !== null) {
+    const isAmount = !!match[1] || !!match[3] ||
+      (lastAmountEnd >= 0 && RANGE_SEPARATOR.test(raw.slice(lastAmountEnd, match.index)));
+    if (!isAmount) continue;
+    lastAmountEnd = match.index + match[0].length;
+
+    let value = parseFloat(match[2].replace(/,/g, ''));
+    const unit = (match[3] || '').toLowerCase();
+    if (unit === 'k' || unit === 'thousand') value *= 1_000;
+    if (unit === 'm' || unit === 'million') value *= 1_000_000;
+    if (!isNaN(value)) values.push(value);
+  }
+
+  if (values.length === 0) return { min: null, max: null };
+
+  const max = Math.max(...values);
+  // "up to $10k" only bounds the award from above
+  const min = /up\s+to|maximum|max\.?\s/i.test(raw) && values.length === 1 ? null : Math.min(...values);
+  return { min, max };
+};
+
+const isLeapYear = (year: number): boolean => (year % 4 === 0 && year % 100 !== 0) || year % 400 === 0;
+
+/**
+ * Epoch milliseconds for a calendar date, or NaN for impossible dates
+ * like 02/31 that Date.UTC would roll over into the next month
+ */
+const utc = (year: number, month: number, day: number): number => {
+  if (month < 0 || month > 11 || day < 1) return NaN;
+  const daysInMonth = month === 1 && isLeapYear(year) ? 29 : DAYS_IN_MONTH[month];
+  return day > daysInMonth ? NaN : Date.UTC(year, month, day);
+};
+
+/**
+ * Parse a deadline string to epoch milliseconds. Only ISO, US (MM/DD/YYYY)
+ * and long ("March 1, 2026") dates are accepted; anything else, such as
+ * "Fall 2026" or a date without a year, parses to NaN rather than to a
+ * guessed day.
+ */
+export const parseDeadline = (raw: string): number => {
+  const value = (raw || '').trim();
+  if (!value || value === 'Not available') return NaN;
+
+  let match = ISO_DATE.exec(value);
+  if (match) {
+    const date = utc(+match[1], +match[2] - 1, +match[3]);
+    // Full timestamps keep their time of day once the date is known valid
+    return isNaN(date) || value.length === 10 ? date : Date.parse(value);
+  }
+
+  match = US_DATE.exec(value);
+  if (match) {
+    const year = match[3].length === 2 ? 2000 + +match[3] : +match[3];
+    return utc(year, +match[1] - 1, +match[2]);
+  }
+
+  match = LONG_DATE.exec(value);
+  if (match) {
+    const month = MONTHS[match[1].toLowerCase()];
+    return month === undefined ? NaN : utc(+match[3], month, +match[2]);
+  }
+
+  return NaN;
+};
+
+/**
+ * Split and trim an eligibility/requirements value, dropping empties
+ */
+export const normalizeList = (value: unknown): string[] => {
+  const items = Array.isArray(value) ? value : typeof value === 'string' ? value.split(/[,;\n]/) : [];
+  return items
+    .map(item => String(item).trim())
+    .filter(item => item.length > 0 && item !== 'Not available');
+};
+
+const isPresent = (value: unknown): boolean =>
+  typeof value === 'string' ? value.trim() !== '' && value !== 'Not available' : !!value;
+
+/**
+ * Count quality tiers for a batch of items. An item is high quality with
+ * at least 5 of the quality fields present, medium with at least 3.
+ */
+export const scoreQualityTiers = (items: any[]): { tiers: QualityTier[]; report: QualityReport } => {
+  const presentCounts = new Uint8Array(items.length);
+
+  for (const field of QUALITY_FIELDS) {
+    for (let i = 0; i < items.length; i++) {
+      if (items[i] && isPresent(items[i][field])) presentCounts[i]++;
+    }
+  }
+
+  const report: QualityReport = { high_quality: 0, medium_quality: 0, low_quality: 0 };
+  const tiers: QualityTier[] = new Array(items.length);
+  for (let i = 0; i < items.length; i++) {
+    if (presentCounts[i] >= 5) {
+      tiers[i] = 'high';
+      report.high_quality++;
+    } else if (presentCounts[i] >= 3) {
+      tiers[i] = 'medium';
+      report.medium_quality++;
+    } else {
+      tiers[i] = 'low';
+      report.low_quality++;
+    }
+  }
+
+  return { tiers, report };
+};
+
+/**
+ * Normalize a batch of scraped items into columnar amount, deadline and
+ * list values plus quality tiers
+ */
+export const normalizeBatch = (items: any[]): NormalizedBatch => {
+  const count = items.length;
+  const amountMin = new Float64Array(count).fill(NaN);
+  const amountMax = new Float64Array(count).fill(NaN);
+  const deadlines = new Float64Array(count).fill(NaN);
+  const eligibility: string[][] = new Array(count);
+  const requirements: string[][] = new Array(count);
+
+  // Scraped amounts, deadlines and list values repeat heavily within a batch
+  const amountCache = new Map<string, AmountRange>();
+  const deadlineCache = new Map<string, number>();
+  const listCache = new Map<string, string[]>();
+  const cachedList = (value: unknown): string[] => {
+    if (typeof value !== 'string') return normalizeList(value);
+    let list = listCache.get(value);
+    if (!list) {
+      list = normalizeList(value);
+      listCache.set(value, list);
+    }
+    return list.slice();
+  };
+
+  for (let i = 0; i < count; i++) {
+    const rawAmount = String(items[i]?.amount ?? '');
+    let range = amountCache.get(rawAmount);
+    if (!range) {
+      range = parseAmountRange(rawAmount);
+      amountCache.set(rawAmount, range);
+    }
+    if (range.min !== null) amountMin[i] = range.min;
+    if (range.max !== null) amountMax[i] = range.max;
+  }
+
+  for (let i = 0; i < count; i++) {
+    const rawDeadline = String(items[i]?.deadline ?? '');
+    let deadline = deadlineCache.get(rawDeadline);
+    if (deadline === undefined) {
+      deadline = parseDeadline(rawDeadline);
+      deadlineCache.set(rawDeadline, deadline);
+    }
+    deadlines[i] = deadline;
+  }
+
+  for (let i = 0; i < count; i++) {
+    eligibility[i] = cachedList(items[i]?.eligibility);
+    requirements[i] = cachedList(items[i]?.requirements);
+  }
+
+  const { tiers, report } = scoreQualityTiers(items);
+
+  return { amountMin, amountMax, deadlines, eligibility, requirements, tiers, qualityReport: report };
+};
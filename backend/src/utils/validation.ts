@@ -64,6 +64,8 @@ export const validateScholarshipData = (scholarship: Partial<Scholarship>): stri
 
   if (!scholarship.deadline) {
     errors.push('Deadline is required');
+  } else if (isNaN(scholarship.deadline.getTime())) {
+    errors.push('Deadline must be a valid date');
   } else if (!isFutureDate(scholarship.deadline)) {
     errors.push('Deadline must be in the future');
   }